@@ -1,3 +1,4 @@
+import functools
 import json
 import pickle
 import re
@@ -12,6 +13,10 @@ from ..schemas.logs import LogOut, LogQuery
 router = APIRouter()
 
 SAFE_WELL_RE = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_-]*$")
+LOG_CACHE_SIZE = 32
+# Lookup order for a well's log file: a Parquet frame decodes much faster
+# than unpickling the full well object, so it wins when both exist.
+LOG_SUFFIXES = (".parquet", ".pkl")
 
 class WellDataError(Exception):
     def __init__(self, message: str, errors: list[dict], error_count: int) -> None:
@@ -34,8 +39,10 @@ def _normalize_well_name(well: str) -> str:
             errors=[{"code": "empty_well", "detail": "Well name cannot be empty."}],
             error_count=1,
         )
-    if name.lower().endswith(".pkl"):
-        name = name[:-4]
+    for suffix in LOG_SUFFIXES:
+        if name.lower().endswith(suffix):
+            name = name[:-len(suffix)]
+            break
     if "/" in name or "\\" in name:
         raise WellDataError(
             "Invalid well name: path separators are not allowed.",
@@ -94,17 +101,42 @@ def get_log(logs_dir: Path, well: str) -> dict[str, Any]:
     if not logs_dir.is_dir():
         raise FileNotFoundError(f"Logs path is not a directory: {logs_dir}")
 
-    log_path = logs_dir / f"{name}.pkl"
-    if not log_path.exists():
-        raise FileNotFoundError(f"Log file not found: {log_path}")
+    log_path = next(
+        (path for path in (logs_dir / f"{name}{suffix}" for suffix in LOG_SUFFIXES)
+         if path.exists()),
+        None,
+    )
+    if log_path is None:
+        raise FileNotFoundError(
+            f"Log file not found: {logs_dir / name}{{{','.join(LOG_SUFFIXES)}}}"
+        )
+
+    stat = log_path.stat()
+    return _load_log_payload(str(log_path), stat.st_mtime_ns, stat.st_size)
+
+@functools.lru_cache(maxsize=LOG_CACHE_SIZE)
+def _load_log_payload(path: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    """
+    Load a log file and convert its frame to a JSON-ready dict.
+
+    A ``.parquet`` file is read directly as the log frame; anything else is
+    unpickled as a well log object exposing ``df()``.
 
+    Cached per (path, mtime_ns, size): repeated requests for an unchanged
+    file skip the load and frame serialization, and a rewritten file
+    gets a new key. The returned dict is shared between requests and must
+    be treated as read-only.
+    """
     try:
-        with log_path.open("rb") as f:
-            log_obj = pickle.load(f)
+        if path.lower().endswith(".parquet"):
+            frame = pd.read_parquet(path)
+        else:
+            with open(path, "rb") as f:
+                frame = pickle.load(f).df()
     except Exception as exc:
-        raise ValueError(f"Failed to load log file: {log_path}") from exc
+        raise ValueError(f"Failed to load log file: {path}") from exc
 
-    payload = log_obj.df().to_json()
+    payload = frame.to_json()
     # if not isinstance(payload, dict):
     #     payload = {"data": payload}
 
@@ -1,11 +1,18 @@
+import contextlib
+import hashlib
+import importlib.util
 import json
+import os
 
 import re
+import tempfile
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 
 from fastapi import APIRouter, Request
-from fastapi import HTTPException, Query
+from fastapi import HTTPException, Query, Response
 
 import pandas as pd
 
@@ -26,14 +33,155 @@ ALLOWED_AGG_FUNCTIONS = {
 
 _AGG_RE = re.compile(r"^\s*(?P<col>[^:]+)\s*:\s*(?P<func>[^:]+)\s*$")
 DEFAULT_LOOKBACK_DAYS = 365
+# Query parameters of /rates that are not column filters.
+RESERVED_QUERY_KEYS = frozenset({"date", "agg", "start", "end", "limit"})
+
+# /rates response bodies (JSON bytes) and /rates/meta dicts keyed by the rates
+# file (path + stamp) and the request parameters.
+RATES_CACHE_SIZE = 64
+_rates_cache: "OrderedDict[tuple, Any]" = OrderedDict()
+_rates_cache_lock = threading.Lock()
+
+def _frame_key(app, df: pd.DataFrame) -> Optional[tuple]:
+    """
+    Identity of the loaded rates frame `df` for the response cache: the file
+    path and its (mtime_ns, size) stamp, which _ensure_rates_fresh bumps
+    whenever it reloads.
+
+    Returns None (do not cache) when the frame has no backing file, or when
+    another request swapped in a reloaded frame after `df` was fetched; the
+    stamp read here could then belong to the new file while `df` holds the
+    old data.
+    """
+    path = getattr(app.state, "rates_path", None)
+    stamp = getattr(app.state, "rates_stamp", None)
+    if not path or stamp is None or getattr(app.state, "rates", None) is not df:
+        return None
+    return (str(path), stamp)
+
+def _cached_rates(key: Optional[tuple]) -> Any:
+    if key is None:
+        return None
+    with _rates_cache_lock:
+        value = _rates_cache.get(key)
+        if value is not None:
+            _rates_cache.move_to_end(key)
+        return value
+
+def _store_rates(key: Optional[tuple], value: Any) -> None:
+    if key is None:
+        return
+    with _rates_cache_lock:
+        _rates_cache[key] = value
+        _rates_cache.move_to_end(key)
+        while len(_rates_cache) > RATES_CACHE_SIZE:
+            _rates_cache.popitem(last=False)
+
+_HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+def _parquet_cache_path(path: Path) -> Optional[Path]:
+    """
+    Location of the Parquet mirror of `path` under RATES_CACHE_DIR, or None
+    when the cache is not configured. The name is `<source key>.<mtime_ns>.<size>`
+    where the source key hashes the CSV path, so an edited CSV never hits a
+    stale mirror and older mirrors of the same CSV can be found and pruned.
+    """
+    cache_dir = os.getenv("RATES_CACHE_DIR", "").strip()
+    if not cache_dir or not _HAS_PYARROW:
+        return None
+
+    mtime_ns, size = _file_stamp(path)
+    return Path(cache_dir) / f"{_source_key(path)}.{mtime_ns}.{size}.parquet"
+
+def _source_key(path: Path) -> str:
+    return hashlib.sha1(str(path.resolve()).encode()).hexdigest()
+
+def _write_parquet_mirror(df: pd.DataFrame, cached: Path, source: Path) -> None:
+    """
+    Write the mirror atomically and drop older mirrors of the same CSV.
+
+    The frame goes to a temp file in the cache dir and is moved into place
+    with os.replace, so a reader never sees a half-written mirror even when
+    two workers write at once.
+    """
+    cached.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=cached.parent, prefix=cached.name, suffix=".tmp")
+    os.close(fd)
+    try:
+        df.to_parquet(tmp, compression="zstd")
+        os.replace(tmp, cached)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp)
+        raise
+
+    for stale in cached.parent.glob(f"{_source_key(source)}.*.parquet"):
+        if stale != cached:
+            with contextlib.suppress(OSError):
+                stale.unlink()
 
 def _load_rates_csv(path: Path) -> pd.DataFrame:
+    cached = _parquet_cache_path(path)
+    if cached is not None and cached.exists():
+        try:
+            return _arrow_strings(pd.read_parquet(cached))
+        except (OSError, ValueError):
+            pass  # unreadable mirror (e.g. truncated); rebuild it from the CSV
+
+    df = _arrow_strings(_read_rates_csv(path))
+
+    if cached is not None:
+        try:
+            _write_parquet_mirror(df, cached, path)
+        except (OSError, ValueError):
+            pass  # the cache is best-effort; the parsed frame is still valid
+
+    return df
+
+def _read_rates_csv(path: Path) -> pd.DataFrame:
+    # The pyarrow CSV reader is multi-threaded; it does not support dayfirst,
+    # so dates are parsed after the read when it is used.
+    if _HAS_PYARROW:
+        df = pd.read_csv(path, engine="pyarrow")
+        if "date" in df.columns:
+            # coerce like the default reader's fallback: a bad row becomes NaT
+            # (and is dropped by get_rates) instead of failing the whole load
+            df["date"] = pd.to_datetime(df["date"], dayfirst=True, errors="coerce")
+        return df
+
     return pd.read_csv(
         path,
         parse_dates=["date"],
         dayfirst=True,
     )
 
+def _arrow_strings(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Store text columns (well names, fluid types, ...) as Arrow-backed strings.
+
+    Object columns hold one Python str per cell; Arrow keeps them in a single
+    buffer, which roughly halves their memory and makes the isin filters and
+    row slicing in get_rates cheaper. Numeric and date columns keep their NumPy
+    dtypes so grouping and date arithmetic are unchanged.
+    """
+    if not _HAS_PYARROW:
+        return df
+
+    text = [col for col, dtype in df.dtypes.items() if dtype == object]
+    if text:
+        df = df.astype({col: "string[pyarrow]" for col in text})
+    return df
+
+def _file_stamp(path: Path) -> tuple[int, int]:
+    """Cheap change key for a file: (mtime in ns, size in bytes).
+
+    Float ``st_mtime`` can miss rewrites that land within its resolution;
+    the integer nanosecond stamp plus the size catches those without
+    reading or hashing the file contents.
+    """
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
 def _ensure_rates_fresh(app) -> pd.DataFrame:
     df = getattr(app.state, "rates", None)
     if df is None:
@@ -45,15 +193,15 @@ def _ensure_rates_fresh(app) -> pd.DataFrame:
 
     path = Path(path)
     try:
-        mtime = path.stat().st_mtime
+        stamp = _file_stamp(path)
     except FileNotFoundError:
         raise HTTPException(status_code=500, detail=f"Rates file not found: {path}")
     except OSError as e:
         raise HTTPException(status_code=500, detail=f"Failed to access rates file: {e}")
 
-    if getattr(app.state, "rates_mtime", None) != mtime:
+    if getattr(app.state, "rates_stamp", None) != stamp:
         app.state.rates = _load_rates_csv(path)
-        app.state.rates_mtime = mtime
+        app.state.rates_stamp = stamp
 
     return app.state.rates
 
@@ -162,31 +310,34 @@ def get_rates(
     limit: Optional[int] = None,
     default_days: Optional[int] = None,
 ) -> str:
-    # Read the CSV file
-    rates = df.copy()
-
-    rates[date_col] = pd.to_datetime(rates[date_col], errors="coerce")
-    rates = rates.dropna(subset=[date_col])
+    # The cached frame is shared between requests and must not be mutated:
+    # build one row mask against it and slice once instead of copying it.
+    # the loader already parses the date column; only coerce frames that
+    # arrive with it as text (dtype check only, nothing is copied)
+    dates = df[date_col]
+    if dates.dtype.kind != "M":
+        dates = pd.to_datetime(dates, errors="coerce")
+    mask = dates.notna()
 
     if filter_dict is not None:
         for col, values in filter_dict.items():
-            if col in rates.columns and values:
-                rates = rates[rates[col].isin(values)]
+            if col in df.columns and values:
+                mask &= df[col].isin(values)
 
-    if rates.empty:
-        return rates.to_json(orient="columns")
+    if not mask.any():
+        return df.loc[mask].to_json(orient="columns")
 
     if start_date is None and end_date is None and default_days:
-        last_date = rates[date_col].max()
-        if pd.isna(last_date):
-            return rates.to_json(orient="columns")
+        last_date = dates[mask].max()
         start_date = last_date - pd.Timedelta(days=default_days - 1)
 
     if start_date is not None:
-        rates = rates[rates[date_col] >= start_date]
+        mask &= dates >= start_date
 
     if end_date is not None:
-        rates = rates[rates[date_col] <= end_date]
+        mask &= dates <= end_date
+
+    rates = df.loc[mask].assign(**{date_col: dates[mask]})
 
     if agg_dict is not None:
         _validate_agg_dict(agg_dict)
@@ -232,14 +383,25 @@ def list_rates(
 ):
     df = _ensure_rates_fresh(request.app)
 
-    reserved_keys = {"date", "agg", "start", "end", "limit"}
-
     filter_dict: Dict[str, List[str]] = {}
     for key, value in request.query_params.multi_items():
-        if key in reserved_keys:
+        if key in RESERVED_QUERY_KEYS:
             continue
         filter_dict.setdefault(key, []).append(value)
 
+    frame_key = _frame_key(request.app, df)
+    cache_key = None if frame_key is None else (
+        frame_key,
+        tuple(sorted((k, tuple(v)) for k, v in filter_dict.items())),
+        tuple(agg or ()),
+        start,
+        end,
+        limit,
+    )
+    cached = _cached_rates(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
     try:
         agg_dict = _parse_agg_params(agg, df) if agg else None
         start_date = _parse_date_param(start, "start")
@@ -267,30 +429,41 @@ def list_rates(
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-    return json.loads(rates_json)
+    # to_json already produced the response body; send its bytes as-is rather
+    # than json.loads-ing it into dicts for FastAPI to encode a second time.
+    body = rates_json.encode()
+    _store_rates(cache_key, body)
+    return Response(content=body, media_type="application/json")
 
 @router.get("/rates/meta")
 def rates_meta(request: Request):
     df = _ensure_rates_fresh(request.app)
 
+    # Metadata depends only on the loaded frame, so it shares the /rates LRU
+    # under a "meta" key that cannot collide with the query keys.
+    frame_key = _frame_key(request.app, df)
+    cache_key = None if frame_key is None else ("meta", frame_key)
+    cached = _cached_rates(cache_key)
+    if cached is not None:
+        return cached
+
+    # One pass over the dtypes; dtype.kind avoids building a Series per column.
+    # "b" is kept numeric to match pd.api.types.is_numeric_dtype.
+    kinds = {col: dtype.kind for col, dtype in df.dtypes.items()}
+
     # Identify date-like column (prefer explicit 'date')
-    date_column = "date" if "date" in df.columns else None
+    date_column = "date" if "date" in kinds else None
     if date_column is None:
-        for col in df.columns:
-            if pd.api.types.is_datetime64_any_dtype(df[col]):
-                date_column = col
-                break
+        date_column = next((col for col, kind in kinds.items() if kind == "M"), None)
 
     numeric_fields = [
-        col for col in df.columns
-        if pd.api.types.is_numeric_dtype(df[col]) and col != date_column
+        col for col, kind in kinds.items()
+        if kind in "biufc" and col != date_column
     ]
 
     categorical_fields = [
-        col for col in df.columns
-        if not pd.api.types.is_numeric_dtype(df[col])
-        and not pd.api.types.is_datetime64_any_dtype(df[col])
-        and col != date_column
+        col for col, kind in kinds.items()
+        if kind not in "biufcM" and col != date_column
     ]
 
     categories = {}
@@ -300,13 +473,15 @@ def rates_meta(request: Request):
         categories[col] = sorted({str(v) for v in uniques if str(v)})
         category_counts[col] = len(categories[col])
 
-    return {
+    result = {
         "date_column": date_column,
         "numeric_fields": numeric_fields,
         "categorical_fields": categorical_fields,
         "categories": categories,
         "category_counts": category_counts,
     }
+    _store_rates(cache_key, result)
+    return result
 
 if __name__ == "__main__":
 
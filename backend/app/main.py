@@ -53,11 +53,7 @@ def load_wells(path: Path) -> dict:
         return json.load(f)
 
 def load_rates(path: Path) -> pd.DataFrame:
-    return pd.read_csv(
-        path,
-        parse_dates=["date"],
-        dayfirst=True,
-    )
+    return rates._load_rates_csv(path)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -67,7 +63,7 @@ async def lifespan(app: FastAPI):
     app.state.rates = None
     app.state.wells_path = None
     app.state.rates_path = None
-    app.state.rates_mtime = None
+    app.state.rates_stamp = None
 
     data_dir, error = _validate_data_dir()
     if error or data_dir is None:
@@ -87,7 +83,7 @@ async def lifespan(app: FastAPI):
     try:
         app.state.wells = load_wells(wells_path)
         app.state.rates = load_rates(rates_path)
-        app.state.rates_mtime = rates_path.stat().st_mtime
+        app.state.rates_stamp = rates._file_stamp(rates_path)
     except Exception as exc:
         app.state.config_error = f"Failed to load data files: {exc}"
         app.state.wells = None
@@ -1,7 +1,41 @@
+import functools
+import importlib.util
+import os
+
 from typing import Union, List, Dict
 
 import pandas as pd
 
+SHEET_CACHE_SIZE = 16
+
+# python-calamine (Rust) parses .xlsx/.xls several times faster than openpyxl;
+# None lets pandas pick its default engine when it is not installed.
+_EXCEL_ENGINE = "calamine" if importlib.util.find_spec("python_calamine") else None
+
+def _read_excel(source,sheet_name:Union[str,int]) -> pd.DataFrame:
+    return pd.read_excel(source,sheet_name=sheet_name,header=None,engine=_EXCEL_ENGINE)
+
+@functools.lru_cache(maxsize=SHEET_CACHE_SIZE)
+def _read_sheet(path:str,sheet_name:Union[str,int],mtime_ns:int,size:int) -> pd.DataFrame:
+    """Raw header-less sheet, cached per (path, sheet, mtime_ns, size).
+
+    Parsing .xlsx is by far the slowest step of TableStack; a rewritten file
+    gets a new stamp and is re-read. The cached frame is shared, so callers
+    must copy it before editing.
+    """
+    return _read_excel(path,sheet_name)
+
+def _load_sheet(file_path,sheet_name:Union[str,int]) -> pd.DataFrame:
+    """Reads a sheet through the cache when file_path is a path on disk."""
+    if not isinstance(file_path,(str,os.PathLike)):
+        # buffers/uploads have no stable identity to cache on
+        return _read_excel(file_path,sheet_name)
+
+    path = os.path.abspath(os.fspath(file_path))
+    stat = os.stat(path)
+
+    return _read_sheet(path,sheet_name,stat.st_mtime_ns,stat.st_size).copy()
+
 class TableStack():
 
     def __init__(self,printFlag:bool=True):
@@ -128,7 +162,7 @@ class TableStack():
         - The extracted tables after cleaning.
         """
         # Step 1: Read the specified sheet from the Excel file into a DataFrame, with no header
-        frame = pd.read_excel(file_path,sheet_name=sheet_name,header=None)
+        frame = _load_sheet(file_path,sheet_name)
 
         # Step 2: Call the 'extract' function to read and process the tables from the Excel sheet
         tables = self._extract(frame,*args)
@@ -1,9 +1,84 @@
 import copy
+import functools
+import math
 
 from typing import Dict, Any
 
+import numpy as np
+
 import pandas as pd
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; NumPy reductions are used without it
+    njit = None
+
+# NaN-skipping reductions over a contiguous float64 array; they mirror the
+# pandas defaults (skipna=True, ddof=1 for std) so jit_agg can stand in for
+# frame[col].<how>() on numeric columns.
+def _sum(a: np.ndarray) -> float:
+    s = 0.0
+    for i in range(a.shape[0]):
+        if not math.isnan(a[i]):
+            s += a[i]
+    return s
+
+def _mean(a: np.ndarray) -> float:
+    s, n = 0.0, 0
+    for i in range(a.shape[0]):
+        if not math.isnan(a[i]):
+            s += a[i]
+            n += 1
+    return s / n if n else math.nan
+
+def _min(a: np.ndarray) -> float:
+    m = math.inf
+    n = 0
+    for i in range(a.shape[0]):
+        if not math.isnan(a[i]):
+            n += 1
+            if a[i] < m:
+                m = a[i]
+    return m if n else math.nan
+
+def _max(a: np.ndarray) -> float:
+    m = -math.inf
+    n = 0
+    for i in range(a.shape[0]):
+        if not math.isnan(a[i]):
+            n += 1
+            if a[i] > m:
+                m = a[i]
+    return m if n else math.nan
+
+def _std(a: np.ndarray) -> float:
+    # Welford's update keeps the single pass numerically stable
+    mean, m2, n = 0.0, 0.0, 0
+    for i in range(a.shape[0]):
+        if not math.isnan(a[i]):
+            n += 1
+            d = a[i] - mean
+            mean += d / n
+            m2 += d * (a[i] - mean)
+    return math.sqrt(m2 / (n - 1)) if n > 1 else math.nan
+
+if njit is not None:
+    _sum = njit(cache=True)(_sum)
+    _mean = njit(cache=True)(_mean)
+    _min = njit(cache=True)(_min)
+    _max = njit(cache=True)(_max)
+    _std = njit(cache=True)(_std)
+else:
+    # As plain Python the loops above would be far slower than NumPy's own
+    # NaN-skipping reductions, so use those instead.
+    _sum = np.nansum
+    _mean = np.nanmean
+    _min = np.nanmin
+    _max = np.nanmax
+    _std = functools.partial(np.nanstd, ddof=1)
+
+_REDUCERS = {"sum": _sum, "mean": _mean, "min": _min, "max": _max, "std": _std}
+
 class Table(pd.DataFrame):
     """
     A ``DataFrame`` subclass that lets you access **columns via alias attributes**
@@ -93,9 +168,17 @@ class Table(pd.DataFrame):
         3) Otherwise, raise AttributeError.
 
         """
-        # Only called if normal attribute lookup fails, so it's safe
-        if self._tiein and name in self._tiein:
-            column = self._tiein[name]
+        # Only called if normal attribute lookup fails. Private names are never
+        # aliases or columns, and pandas probes many of them while building
+        # frames, so hand them straight back to the default lookup.
+        if name.startswith("_"):
+            return object.__getattribute__(self, name)
+
+        # read _tiein from __dict__ so a frame without it (mid-construction,
+        # unpickling) cannot recurse back into __getattr__
+        tiein = self.__dict__.get("_tiein")
+        column = tiein.get(name) if tiein else None
+        if column is not None:
             if column in self.columns:
                 return self[column]
             raise AttributeError(
@@ -107,6 +190,52 @@ class Table(pd.DataFrame):
 
         raise AttributeError(f"{type(self).__name__!s} has no attribute '{name}'")
 
+    def jit_agg(self, name: str, how: str = "sum") -> float:
+        """
+        Reduce one numeric column with a compiled loop.
+
+        Parameters
+        ----------
+        name : str
+            ``tiein`` alias or real column name.
+        how : {"sum", "mean", "min", "max", "std"}
+            Reduction to apply; NaNs are skipped as in pandas.
+
+        Returns
+        -------
+        float
+            The reduced value (NaN when the column has no valid values,
+            except ``sum`` which returns 0.0).
+
+        Notes
+        -----
+        The column is handed to the kernel as a contiguous float64 array,
+        which skips the pandas reduction dispatch. Without numba the NumPy
+        ``nan*`` reductions are used instead of the loops.
+
+        """
+        try:
+            reducer = _REDUCERS[how]
+        except KeyError:
+            raise ValueError(
+                f"Unknown reduction '{how}'; expected one of {sorted(_REDUCERS)}."
+            ) from None
+
+        # same guarded read as __getattr__: _tiein may be missing on frames
+        # pandas builds internally or restores from a pickle
+        tiein = self.__dict__.get("_tiein")
+        column = tiein.get(name, name) if tiein else name
+        if column not in self.columns:
+            raise KeyError(column)
+
+        values = np.ascontiguousarray(self[column].to_numpy(dtype=np.float64, na_value=np.nan))
+
+        if values.size == 0:
+            # np.nanmin/np.nanmax reject empty input; keep one answer for both paths
+            return 0.0 if how == "sum" else math.nan
+
+        return float(reducer(values))
+
     @property
     def datetimes(self):
         """Returns the list of column names with datetime format."""
@@ -146,9 +275,12 @@ class Table(pd.DataFrame):
         if include is None and exclude is None:
             return head_list
 
-        head_list += frame.select_dtypes(include=include,exclude=exclude).columns.tolist()
+        # select on a zero-row slice: only the dtypes matter, so no column
+        # data is touched however long the frame is
+        head_list += frame.iloc[:0].select_dtypes(include=include,exclude=exclude).columns.tolist()
 
-        return list(set(head_list))
+        # drop duplicates but keep args first, then frame order
+        return list(dict.fromkeys(head_list))
 
     @staticmethod
     def join_columns(frame:pd.DataFrame,*args,sep:str=None,**kwargs)->pd.DataFrame:
@@ -4,7 +4,7 @@ import types
 
 from typing import Optional
 
-@dataclass
+@dataclass(slots=True)
 class Section:
     """
     Represents a single tubular section (casing/liner/tubing, etc.)
@@ -55,39 +55,26 @@ class Section:
         f = cls.__dataclass_fields__[name]
         f.metadata = types.MappingProxyType(dict(new_metadata))
         
-class Layout():
+class Layout(list):
+    """A collection of 'Section' objects with list-like access."""
 
-    def __init__(self,*args:Section):
-
-        self._list = list(args)
-
-    def __getitem__(self,key):
-        """Retrieves a 'Section' object by index."""
-        return self._list[key]
+    __slots__ = ()
 
-    def __iter__(self):
-        """Allows iteration over the 'Section' objects."""
-        return iter(self._list)
+    def __init__(self,*args:Section):
 
-    def __len__(self) -> int:
-        """Returns the number of 'Section' objects."""
-        return len(self._list)
+        super().__init__(args)
 
     def add(self,**kwargs):
         """Adds one pipe item."""
-        self._list.append(Section(**kwargs))
+        super().append(Section(**kwargs))
 
     def append(self,pipe:Section) -> None:
         """Adds a new 'Section' object to the collection."""
         if not isinstance(pipe, Section):
             raise TypeError("Only Section objects can be added.")
-        self._list.append(pipe)
+        super().append(pipe)
 
     def extend(self,pipes:list[Section]) -> None:
         """Adds a new 'Section' object to the collection."""
         for pipe in pipes:
             self.append(pipe)
-
-    def __getattr__(self,key):
-        """Forwards attribute access to the internal list object."""
-        return getattr(self._list,key)
\ No newline at end of file
@@ -1,10 +1,12 @@
 from dataclasses import dataclass
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable
 
 import re
 
 _DEFAULT_INDEX_RE = re.compile(r"(?P<prefix>.*?)(?P<index>\d+)(?P<suffix>.*)$")
+_DEFAULT_DIGIT_RE = re.compile(r"\d+")
+_WHITESPACE_RE = re.compile(r"\s+")
 
 @dataclass(frozen=True, slots=True)
 class Name:
@@ -23,7 +25,7 @@ class Name:
     @staticmethod
     def _canonicalize(name:str) -> str:
         # trim, collapse whitespace, uppercase for consistent matching
-        return re.sub(r"\s+", " ", name.strip()).upper()
+        return _WHITESPACE_RE.sub(" ", name.strip()).upper()
 
     def canonical(self,sep:str="-") -> str:
         """Uppercased, collapsed whitespace version of the name."""
@@ -72,14 +74,22 @@ class Name:
         str: The extracted content, or the original string if no match is found.
 
         """
-        regex = r'\d+' if regex is None else regex
+        pattern = _DEFAULT_DIGIT_RE if regex is None else re.compile(regex)
         # previous version of the code : r"'(.*?)'"
         # previous chatgpt suggestion : r"'([^']*)'"
 
-        match = re.search(regex,name)
+        match = pattern.search(name)
         
         return match.group() if match else name
 
+    @staticmethod
+    def parse_many(names:Iterable[str],regex:str|None=None) -> list[str]:
+        """Applies `parse` to many names, compiling the regular expression only once."""
+        pattern = _DEFAULT_DIGIT_RE if regex is None else re.compile(regex)
+        search = pattern.search
+
+        return [m.group() if (m := search(name)) else name for name in names]
+
     # ---------- Formatting / generation ----------
     @staticmethod
     def apply(index:int,template:str|None=None) -> str:
@@ -103,11 +113,33 @@ class Name:
 
         try:
             return template.format(index) if "{}" in template else template.format(index=index)
-        except Exception as e:
+        except (IndexError, KeyError, ValueError) as e:
             raise ValueError(
                 f"Invalid template '{template}' for index '{index}'. Error: {e}"
             ) from e
 
+    @staticmethod
+    def apply_many(indices:Iterable[int],template:str|None=None) -> list[str]:
+        """Generates well names for many indices with the same template as `apply`.
+
+        The template is inspected and its bound ``format`` method looked up once,
+        so each name costs a single format call.
+
+        """
+        template = "Well-{}" if template is None else template
+
+        fmt = template.format
+        positional = "{}" in template
+
+        try:
+            if positional:
+                return [fmt(index) for index in indices]
+            return [fmt(index=index) for index in indices]
+        except (IndexError, KeyError, ValueError) as e:
+            raise ValueError(
+                f"Invalid template '{template}'. Error: {e}"
+            ) from e
+
     @classmethod
     def from_components(cls, prefix: str = "Well-", index: Optional[int] = None,
                         suffix: str = "", pad: Optional[int] = None) -> "Name":
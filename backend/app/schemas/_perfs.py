@@ -6,8 +6,71 @@ import math
 
 from typing import Optional, Literal, Iterable, Self, Union, Tuple, Dict, Any
 
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; the NumPy path is used without it
+    njit, prange = None, range
+
 from wellx.pipes import Table
 
+def _split_interval(s: str, delimiter: str, decsep: str) -> tuple[float, float]:
+    """Parses 'top<delimiter>base' into two finite floats in a single pass."""
+    # skip a leading sign and any exponent sign when locating the delimiter
+    s = s.strip()
+    i = s.find(delimiter, 1)
+    while i > 0 and s[i-1] in "eE":
+        i = s.find(delimiter, i+1)
+    if i < 0:
+        raise ValueError(f"Invalid interval string {s!r}: Expected 'top{delimiter}base'")
+
+    left, right = s[:i], s[i+len(delimiter):]
+    if decsep != ".":
+        left, right = left.replace(decsep, "."), right.replace(decsep, ".")
+
+    try:
+        a, b = float(left), float(right)
+    except ValueError:
+        raise ValueError(f"Invalid interval string {s!r}: Expected 'top{delimiter}base'") from None
+
+    if not (math.isfinite(a) and math.isfinite(b)):
+        raise ValueError(f"Invalid interval string {s!r}: depths must be finite")
+
+    return a, b
+
+def _overlaps_kernel(top1: np.ndarray, base1: np.ndarray,
+                     top2: np.ndarray, base2: np.ndarray, out: np.ndarray) -> None:
+    """Row-parallel closed-interval overlap test; fills `out[i, j]` in place."""
+    for i in prange(top1.size):
+        t, b = top1[i], base1[i]
+        for j in range(top2.size):
+            out[i, j] = t <= base2[j] and b >= top2[j]
+
+if njit is not None:
+    _overlaps_kernel = njit(cache=True, parallel=True)(_overlaps_kernel)
+
+def overlaps_matrix(top1, base1, top2=None, base2=None) -> np.ndarray:
+    """
+    Pairwise overlap of closed intervals [top1[i], base1[i]] and [top2[j], base2[j]].
+
+    Returns a boolean array of shape (len(top1), len(top2)). When the second set
+    is omitted the first set is compared with itself. Uses a compiled kernel when
+    numba is installed and a broadcast NumPy expression otherwise.
+
+    """
+    top1 = np.ascontiguousarray(top1, dtype=float)
+    base1 = np.ascontiguousarray(base1, dtype=float)
+    top2 = top1 if top2 is None else np.ascontiguousarray(top2, dtype=float)
+    base2 = base1 if base2 is None else np.ascontiguousarray(base2, dtype=float)
+
+    if njit is None:
+        return (top1[:, None] <= base2[None, :]) & (base1[:, None] >= top2[None, :])
+
+    out = np.empty((top1.size, top2.size), dtype=np.bool_)
+    _overlaps_kernel(top1, base1, top2, base2, out)
+    return out
+
 @dataclass(slots=True, frozen=True, order=True)
 class PerfInterval:
     """
@@ -33,7 +96,8 @@ class PerfInterval:
     top: float = field(metadata={"unit": "m"})
     base: float = field(default=float('nan'), metadata={"unit": "m"})
 
-    _unit_override: Dict[str, str] = field(default_factory=dict, init=False, repr=False)
+    # created on the first set_unit call; most instances never override units
+    _unit_override: Optional[Dict[str, str]] = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
 
@@ -46,6 +110,15 @@ class PerfInterval:
         object.__setattr__(self, "top", top)
         object.__setattr__(self, "base", base)
 
+    @classmethod
+    def _unchecked(cls, top: float, base: float) -> Self:
+        """Builds an interval from floats already known to satisfy top <= base."""
+        obj = object.__new__(cls)
+        object.__setattr__(obj, "top", top)
+        object.__setattr__(obj, "base", base)
+        object.__setattr__(obj, "_unit_override", None)
+        return obj
+
     # convenience --------------------------------------------------------------
     @property
     def length(self) -> float:
@@ -73,7 +146,7 @@ class PerfInterval:
 
     def get_unit(self, key: str) -> Optional[str]:
         """Return the unit for a field, checking overrides first."""
-        if key in self._unit_override:
+        if self._unit_override and key in self._unit_override:
             return self._unit_override[key]
         for f in fields(self):                 # dataclasses.fields -> tuple[Field, ...]
             if f.name == key:
@@ -85,6 +158,8 @@ class PerfInterval:
         for key, unit in kwargs.items():
             if key not in {f.name for f in fields(self)}:
                 raise AttributeError(f"No field named {key!r}")
+            if self._unit_override is None:
+                object.__setattr__(self, "_unit_override", {})
             self._unit_override[key] = unit
 
     @classmethod
@@ -117,14 +192,22 @@ class PerfInterval:
             is provided, the second element will be None.
 
         """
-        try:
-            parts = [p.strip() for p in s.split(delimiter)]
-            if len(parts) != 2:
-                raise ValueError(f"Expected 'top{delimiter}base'. Got: {s!r}")
-            parts = [float(p.replace(decsep,".")) for p in parts]
-            return cls(min(parts), max(parts))
-        except Exception as e:
-            raise ValueError(f"Invalid interval string {s!r}: {e}") from e
+        if not isinstance(s, str):
+            raise ValueError(f"Invalid interval string {s!r}: expected str")
+
+        a, b = _split_interval(s, delimiter, decsep)
+        return cls._unchecked(a, b) if a <= b else cls._unchecked(b, a)
+
+    @classmethod
+    def from_str_many(cls, strings: Iterable[str], delimiter: str = "-", decsep: str = ".") -> list[Self]:
+        """Parses many interval strings with the same rules as `from_str`."""
+        out = []
+        for s in strings:
+            if not isinstance(s, str):
+                raise ValueError(f"Invalid interval string {s!r}: expected str")
+            a, b = _split_interval(s, delimiter, decsep)
+            out.append(cls._unchecked(a, b) if a <= b else cls._unchecked(b, a))
+        return out
 
 GUN_TYPES: set[str] = {"TCP", "HSD", "JET", "BULLET", "ABRASIVE", "PROPELLANT"}
 
@@ -165,7 +248,7 @@ class Perf:
     Convenience
     -----------
     - `sort_key()` returns a `(well, top, base)` tuple for stable sorting.
-    - `length` property forwards to interval `length`.
+    - `length`, `midpoint`, `contains` and `overlaps` mirror PerfInterval; `interval` returns one.
     - `fields()` returns declared dataclass fields in order (handy for tabular exports).
 
     """
@@ -178,7 +261,8 @@ class Perf:
     formation: Optional[str] = None
     guntype: Optional[str] = None
 
-    _unit_override: Dict[str, str] = field(default_factory=dict, init=False, repr=False)
+    # created on the first set_unit call; most instances never override units
+    _unit_override: Optional[Dict[str, str]] = field(default=None, init=False, repr=False, compare=False)
 
     # normalize/validate -------------------------------------------------------
     def __post_init__(self) -> None:
@@ -190,6 +274,10 @@ class Perf:
 
         top = float(self.top)
         base = top if self.base is None else float(self.base)
+        if math.isnan(base):
+            base = top
+        elif base < top:
+            raise ValueError(f"Perf base ({base}) must be >= top ({top}).")
 
         gt = None
         if self.guntype is not None:
@@ -200,23 +288,30 @@ class Perf:
         object.__setattr__(self, "guntype", gt)
 
     # convenience --------------------------------------------------------------
+    # top/base are validated in __post_init__, so these work on them directly
+    # instead of building a PerfInterval per call.
+    @property
+    def interval(self) -> PerfInterval:
+        """The [top, base] interval as a PerfInterval."""
+        return PerfInterval._unchecked(self.top, self.base)
+
     @property
     def length(self) -> float:
         """PerfInterval length in depth units (project-defined)."""
-        return PerfInterval(self.top,self.base).length
+        return self.base - self.top
 
     @property
     def midpoint(self) -> float:
         """Midpoint MD of the interval."""
-        return PerfInterval(self.top,self.base).midpoint
+        return 0.5 * (self.top + self.base)
 
     def contains(self, depth: float) -> bool:
         """True if `depth` lies within [top, base] (inclusive)."""
-        return PerfInterval(self.top,self.base).contains(depth)
+        return self.top <= depth <= self.base
 
     def overlaps(self, other: Self) -> bool:
         # Closed intervals overlap when max(top) <= min(base)
-        return PerfInterval(self.top,self.base).overlaps(PerfInterval(other.top,other.base))
+        return max(self.top, other.top) <= min(self.base, other.base)
 
     def sort_key(self) -> tuple[str, float, float]:
         """Stable sort key: (well, top, base)."""
@@ -236,7 +331,7 @@ class Perf:
 
     def get_unit(self, key: str) -> Optional[str]:
         """Return the unit for a field, checking overrides first."""
-        if key in self._unit_override:
+        if self._unit_override and key in self._unit_override:
             return self._unit_override[key]
         for f in fields(self):                 # dataclasses.fields -> tuple[Field, ...]
             if f.name == key:
@@ -248,52 +343,110 @@ class Perf:
         for key, unit in kwargs.items():
             if key not in {f.name for f in fields(self)}:
                 raise AttributeError(f"No field named {key!r}")
+            if self._unit_override is None:
+                object.__setattr__(self, "_unit_override", {})
             self._unit_override[key] = unit
 
     @staticmethod
     def fields() -> list[str]:
         """List of dataclass field names (stable order)."""
-        return [f.name for f in fields(Perf) if f.init]
+        return list(Perf._FIELDS)
+
+Perf._FIELDS = tuple(f.name for f in fields(Perf) if f.init)
+
+def _sort_order(perfs:list[Perf]) -> np.ndarray:
+    """Indices ordering `perfs` by (well, top, base); one C-level lexsort."""
+    wells = np.array([perf.well for perf in perfs], dtype=str)
+    tops = np.fromiter((perf.top for perf in perfs), dtype=float, count=len(perfs))
+    bases = np.fromiter((perf.base for perf in perfs), dtype=float, count=len(perfs))
+    return np.lexsort((bases, tops, wells))
+
+def bulk_sort(perfs:Iterable[Perf]) -> list[Perf]:
+    """Same result as `sorted(perfs, key=Perf.sort_key)` without per-item key tuples."""
+    perfs = list(perfs)
+    return [perfs[i] for i in _sort_order(perfs)]
 
-class PerfTable():
+class PerfTable(list):
     """A collection of 'Perf' objects with list-like access."""
 
+    __slots__ = ()
+
     def __init__(self,*args:Perf):
 
-        self._list = list(args)
+        super().__init__(args)
 
     @staticmethod
     def fields() -> list:
         """Returns the list of field names in the Perf dataclass."""
         return Perf.fields()
 
-    def __getitem__(self,key):
-        """Retrieves a 'Perf' object by index."""
-        return self._list[key]
-
-    def __iter__(self):
-        """Allows iteration over the 'Perf' objects."""
-        return iter(self._list)
-
-    def __len__(self) -> int:
-        """Returns the number of 'Perf' objects."""
-        return len(self._list)
-
     def add(self,**kwargs):
         """Adds one perforation item."""
-        self._list.append(Perf(**kwargs))
+        super().append(Perf(**kwargs))
 
     def append(self,perf:Perf) -> None:
         """Adds a new 'Perf' object to the collection."""
         if not isinstance(perf, Perf):
             raise TypeError("Only Perf objects can be added.")
-        self._list.append(perf)
+        super().append(perf)
 
     def extend(self,perfs:list[Perf]) -> None:
         """Adds a new 'Perf' object to the collection."""
         for perf in perfs:
             self.append(perf)
 
-    def __getattr__(self,key):
-        """Forwards attribute access to the internal list object."""
-        return getattr(self._list,key)
+    def sort(self,*,key=None,reverse:bool=False) -> None:
+        """Sorts in place; by default on `Perf.sort_key` order using a bulk lexsort."""
+        if key is not None or reverse:
+            super().sort(key=key or Perf.sort_key,reverse=reverse)
+        elif len(self) > 1:
+            self[:] = [self[i] for i in _sort_order(self)]
+
+    @classmethod
+    def from_perfs(cls,perfs:Iterable[Perf]) -> "PerfTable":
+        """Builds a table from any iterable of 'Perf' objects."""
+        table = cls()
+        table.extend(perfs)
+        return table
+
+    # columnar views -----------------------------------------------------------
+    # Each view is built in one pass over the records; reuse the arrays when
+    # several vectorized operations run on an unchanged table.
+    @property
+    def wells(self) -> np.ndarray:
+        """Well names as an object array."""
+        return np.array([perf.well for perf in self], dtype=object)
+
+    @property
+    def tops(self) -> np.ndarray:
+        """Interval tops as a float array."""
+        return np.fromiter((perf.top for perf in self), dtype=float, count=len(self))
+
+    @property
+    def bases(self) -> np.ndarray:
+        """Interval bases as a float array."""
+        return np.fromiter((perf.base for perf in self), dtype=float, count=len(self))
+
+    @property
+    def dates(self) -> np.ndarray:
+        """Perforation dates as datetime64[D]; missing dates are NaT."""
+        return np.array([perf.date or "NaT" for perf in self], dtype="datetime64[D]")
+
+    def length_sum(self) -> float:
+        """Total perforated length over all records."""
+        return float((self.bases - self.tops).sum())
+
+    def contains(self,depth:float) -> np.ndarray:
+        """Boolean mask of the records whose [top, base] holds `depth`."""
+        tops, bases = self.tops, self.bases
+        return (tops <= depth) & (bases >= depth)
+
+    def sort_by_top(self) -> np.ndarray:
+        """Indices that order the records by top (stable)."""
+        return np.argsort(self.tops, kind="stable")
+
+    def overlaps(self,other:"PerfTable|None"=None) -> np.ndarray:
+        """Pairwise overlap matrix against `other` (or the table itself)."""
+        if other is None:
+            return overlaps_matrix(self.tops, self.bases)
+        return overlaps_matrix(self.tops, self.bases, other.tops, other.bases)
@@ -1,6 +1,7 @@
 from dataclasses import dataclass, field as dcfield, fields as dcfields, is_dataclass
 import datetime
 import json
+from types import MappingProxyType
 from typing import Iterable, Mapping, Optional, Literal, Dict, Any, List, Union, Sequence, Self
 
 import pandas as pd
@@ -230,11 +231,18 @@ class Rate:
     @staticmethod
     def fields() -> list[str]:
         """List of dataclass field names (stable order)."""
-        return [f.name for f in dcfields(Rate) if f.init]
+        return list(Rate._FIELDS)
+
+# resolved once; dataclass fields are fixed after class creation
+Rate._FIELDS = tuple(f.name for f in dcfields(Rate) if f.init)
 
 RateLike = Union["Rate", Mapping[str, Any]]
 
-RateUnit = {f.name: unit for f in dcfields(Rate) if (unit := f.metadata.get("unit"))}
+# Read-only: it is shared by every RateTable through DEFAULT_UNITS, so an
+# in-place edit by one caller would leak into all others.
+RateUnit = MappingProxyType(
+    {f.name: unit for f in dcfields(Rate) if (unit := f.metadata.get("unit"))}
+)
 
 class RateTable(Table):
     """
@@ -245,9 +253,9 @@ class RateTable(Table):
     - Uses Rate(**row) to coerce/validate rows when requested.
     """
 
-    # Optional default unit scales: column_name -> multiplicative factor
-    # Example: {"orate": 1/6.2898}  # STB/d -> m3/d
-    DEFAULT_UNITS: Dict[str, float] = RateUnit
+    # Default unit labels per rate field (from the Rate field metadata).
+    # Read-only; pass unit_scales to convert_units to rescale columns.
+    DEFAULT_UNITS: Mapping[str, str] = RateUnit
 
     # -------- core construction --------
     def __init__(
@@ -275,7 +283,8 @@ class RateTable(Table):
             if data is not None:
                 for item in data:
                     rows.append(self._row_to_dict(item, validate=validate, coerce=coerce))
-            df = pd.DataFrame(rows, columns=Rate.fields()).copy() if copy else pd.DataFrame(rows, columns=Rate.fields())
+            # freshly built from rows, so nothing else can alias it; `copy` is moot
+            df = pd.DataFrame(rows, columns=Rate.fields())
 
         # Guarantee a dict so Table.__getattr__ doesn't trip on None
         kwargs["tiein"] = dict(tiein)
@@ -296,14 +305,14 @@ class RateTable(Table):
     def _row_to_dict(self, item: RateLike, *, validate: bool, coerce: bool) -> Dict[str, Any]:
 
         if is_dataclass(item) and isinstance(item, Rate):
-            row = {f.name: getattr(item, f.name) for f in dcfields(Rate) if f.init}
+            row = {k: getattr(item, k) for k in Rate._FIELDS}
         elif isinstance(item, Mapping):
             row = dict(item)
         else:
             raise TypeError(f"Unsupported row type: {type(item)!r}. Expected Rate or Mapping.")
 
         # Drop extras; add missing as None
-        cleaned = {k: row.get(k, None) for k in Rate.fields()}
+        cleaned = {k: row.get(k, None) for k in Rate._FIELDS}
 
         if validate:
             if coerce:
@@ -358,11 +367,11 @@ class RateTable(Table):
         return cls(rates, **kwargs)
 
     def to_rates(self) -> List["Rate"]:
-        out: List["Rate"] = []
-        for _, row in self.iterrows():
-            payload = {k: row[k] for k in Rate.fields()}
-            out.append(Rate(**payload))
-        return out
+        names = Rate._FIELDS
+        # Column-wise extraction: iterrows would build (and dtype-coerce) a
+        # Series per row, while tolist() hands back plain Python scalars.
+        columns = [self[k].tolist() for k in names]
+        return [Rate(**dict(zip(names, values))) for values in zip(*columns)]
 
     def append_rate(self, rate: "Rate") -> "RateTable":
         row = self._row_to_dict(rate, validate=True, coerce=False)
@@ -177,7 +177,7 @@ class Status:
     @staticmethod
     def fields() -> list:
         """Field names for I/O schemas."""
-        return [f.name for f in fields(Status) if f.name != "meta"]
+        return list(Status._FIELDS)
 
     # Immutable-ish "updaters"
     def with_end(self, ended_at: datetime) -> "Status":
@@ -192,6 +192,8 @@ class Status:
         new_meta.update(kwargs)
         return replace(self, meta=new_meta)
 
+Status._FIELDS = tuple(f.name for f in fields(Status) if f.name != "meta")
+
 # --- Example helper to construct from simple strings/datetimes ---
 def make_status(
     well: str,
@@ -1,11 +1,51 @@
 from dataclasses import dataclass, field, fields
 
+import math
+
 import numpy as np
 
 import pandas as pd
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the NumPy paths are used without it
+    njit = None
+
 _EPS = 1e-12
 
+def _inc2tvd(MD: np.ndarray, INC: np.ndarray) -> np.ndarray:
+    """Single-pass tangential TVD; same result as the NumPy path of `Survey.inc2tvd`."""
+    n = MD.size
+    TVD = np.empty(n)
+    if n == 0:
+        return TVD
+    TVD[0] = MD[0]
+    acc = 0.0
+    for i in range(1, n):
+        acc += (MD[i] - MD[i-1]) * math.cos(INC[i] * math.pi / 180.0)
+        TVD[i] = acc
+    return TVD
+
+def _off2tvd(MD: np.ndarray, DX: np.ndarray, DY: np.ndarray) -> np.ndarray:
+    """Single-pass Pythagorean TVD; same result as the NumPy path of `Survey.off2tvd`."""
+    n = MD.size
+    TVD = np.empty(n)
+    if n == 0:
+        return TVD
+    acc = MD[0]
+    TVD[0] = acc
+    for i in range(1, n):
+        dmd = MD[i] - MD[i-1]
+        ddx = DX[i] - DX[i-1]
+        ddy = DY[i] - DY[i-1]
+        acc += math.sqrt(max(0.0, dmd*dmd - ddx*ddx - ddy*ddy))
+        TVD[i] = acc
+    return TVD
+
+if njit is not None:
+    _inc2tvd = njit(cache=True, fastmath=True)(_inc2tvd)
+    _off2tvd = njit(cache=True, fastmath=True)(_off2tvd)
+
 @dataclass(slots=True)
 class Survey:
     """
@@ -57,14 +97,22 @@ class Survey:
     yhead: float = 0.0
     datum: float = 0.0
 
+    # Cached TVD monotonicity for tvd2md; reset whenever MD/TVD are reassigned.
+    _tvd_increasing: bool | None = field(default=None, init=False, repr=False, compare=False)
+
     # --- lifecycle ---------------------------------------------------------
     def __post_init__(self) -> None:
         self._validate_shapes_and_monotonicity()
 
+    def __setattr__(self, name, value) -> None:
+        object.__setattr__(self, name, value)
+        if name in ("MD", "TVD"):
+            object.__setattr__(self, "_tvd_increasing", None)
+
     @staticmethod
     def fields() -> list[str]:
         """Return dataclass field names (for schema/serialization)."""
-        return [f.name for f in fields(Survey)]
+        return [f.name for f in fields(Survey) if f.init]
 
     # --- basic interpolation helpers --------------------------------------
     def md2tvd(self, values: float | np.ndarray) -> np.ndarray:
@@ -77,7 +125,9 @@ class Survey:
     def tvd2md(self, values: float | np.ndarray) -> np.ndarray:
         self._ensure_available(self.MD, "MD")
         self._ensure_available(self.TVD, "TVD")
-        if not np.all(np.diff(self.TVD) > 0):
+        if self._tvd_increasing is None:
+            self._tvd_increasing = bool(np.all(np.diff(self.TVD) > 0))
+        if not self._tvd_increasing:
             raise ValueError("TVD must be strictly increasing for TVD→MD interpolation.")
         vals = np.asanyarray(values)
         self._check_in_range(vals, self.TVD, "TVD")
@@ -105,16 +155,23 @@ class Survey:
         Fast tangential approximation: TVD[i] = TVD[i-1] + dMD * cos(INC[i]).
         Angles are degrees. Returns TVD with TVD[0]=0.
         """
-        INC = np.asanyarray(INC); MD = np.asanyarray(MD)
+        INC = np.asanyarray(INC, dtype=float); MD = np.asanyarray(MD, dtype=float)
 
         Survey._require_strictly_increasing(MD, "MD")
 
-        TVD = MD.copy()
+        if njit is not None:
+            return _inc2tvd(np.ascontiguousarray(MD), np.ascontiguousarray(INC))
 
-        offset = np.diff(MD)
-        radian = np.deg2rad(INC[1:])
+        TVD = np.empty_like(MD)
+        TVD[:1] = MD[:1]
 
-        TVD[1:] = np.cumsum(offset*np.cos(radian))
+        # single temporary for the angles; every other step reuses TVD[1:]
+        step = TVD[1:]
+        np.subtract(MD[1:], MD[:-1], out=step)
+        cosine = np.deg2rad(INC[1:])
+        np.cos(cosine, out=cosine)
+        np.multiply(step, cosine, out=step)
+        np.cumsum(step, out=step)
 
         return TVD
 
@@ -125,16 +182,31 @@ class Survey:
             dTVD = sqrt(max(0, dMD^2 - dX^2 - dY^2))
         Returns cumulative TVD with TVD[0]=0.
         """
-        MD = np.asanyarray(MD); DX = np.asanyarray(DX); DY = np.asanyarray(DY)
+        MD = np.asanyarray(MD, dtype=float); DX = np.asanyarray(DX, dtype=float); DY = np.asanyarray(DY, dtype=float)
         Survey._require_strictly_increasing(MD, "MD")
 
-        TVD = MD.copy()
+        if njit is not None:
+            return _off2tvd(np.ascontiguousarray(MD), np.ascontiguousarray(DX), np.ascontiguousarray(DY))
+
+        TVD = np.empty_like(MD)
+        TVD[:1] = MD[:1]
+
+        step = TVD[1:]
+        np.subtract(MD[1:], MD[:-1], out=step)
+        np.square(step, out=step)
+
+        lateral = np.diff(DX)
+        np.square(lateral, out=lateral)
+        np.subtract(step, lateral, out=step)
+
+        np.subtract(DY[1:], DY[:-1], out=lateral)
+        np.square(lateral, out=lateral)
+        np.subtract(step, lateral, out=step)
 
-        offMD = np.diff(MD); offDX = np.diff(DX); offDY = np.diff(DY)
-                         
-        TVD[1:] = np.sqrt(offMD**2-offDX**2-offDY**2)
+        np.maximum(step, 0.0, out=step)
+        np.sqrt(step, out=step)
 
-        return np.cumsum(TVD)
+        return np.cumsum(TVD, out=TVD)
 
     @staticmethod
     def minimum_curvature(
@@ -58,6 +58,7 @@ class Tops:
     _formation: List[str] = field(init=False, repr=False)
     _depth: np.ndarray = field(init=False, repr=False)
     _facecolor: Dict[str, str] = field(init=False, repr=False, default_factory=dict)
+    _index: Dict[str, int] = field(init=False, repr=False, default_factory=dict)
 
     def __post_init__(self) -> None:
         
@@ -78,11 +79,16 @@ class Tops:
             dup = [n for n in set(names) if names.count(n) > 1]
             raise ValueError(f"Duplicate formation names not allowed: {dup}")
 
-        # sort shallow → deep by MD; keep names aligned
-        order = np.argsort(depths, kind="mergesort")
+        # sort shallow → deep by MD; keep names aligned. Picks usually arrive
+        # already ordered, in which case one comparison pass replaces the sort.
+        if np.any(depths[1:] < depths[:-1]):
+            order = np.argsort(depths, kind="mergesort")
+            depths = depths[order]
+            names = [names[i] for i in order]
 
-        self._depth = depths[order]
-        self._formation = [names[i] for i in order]
+        self._depth = depths
+        self._formation = names
+        self._reindex()
 
         # store colors as a name→color dict (optional)
         self._facecolor = dict(self.facecolor) if self.facecolor else {}
@@ -106,15 +112,19 @@ class Tops:
         return len(self._formation)
 
     def __contains__(self, name: str) -> bool:
-        return name in self._formation
+        return name in self._index
 
     def index(self, name: str) -> int:
         """Index of a formation by exact (case-sensitive) name."""
         try:
-            return self._formation.index(name)
-        except ValueError as e:
+            return self._index[name]
+        except KeyError as e:
             raise ValueError(f"Formation '{name}' not found.") from e
 
+    def _reindex(self) -> None:
+        """Rebuild the name → position map after the ordering changes."""
+        self._index = {name: i for i, name in enumerate(self._formation)}
+
     def __getitem__(self, name: str) -> float:
         """Alias for `get_top(name)`."""
         return self.get_top(name)
@@ -138,13 +148,8 @@ class Tops:
         Return all formation intervals as (formation, top, bottom), shallow→deep.
         The bottom of the deepest formation is None.
         """
-        out: List[Tuple[str, float, Optional[float]]] = []
-        n = len(self._formation)
-        for i, name in enumerate(self._formation):
-            top = float(self._depth[i])
-            bottom = float(self._depth[i + 1]) if i < n - 1 else None
-            out.append((name, top, bottom))
-        return out
+        tops = self._depth.tolist()
+        return list(zip(self._formation, tops, tops[1:] + [None]))
 
     def find_at_md(self, md: float) -> Optional[str]:
         """
@@ -154,15 +159,11 @@ class Tops:
         Interval convention: [top, bottom) — inclusive at top, exclusive at bottom.
         """
         md = float(md)
-        ints = self.intervals()
-        for name, top, bottom in ints:
-            if bottom is None:
-                if md >= top:
-                    return name
-            else:
-                if top <= md < bottom:
-                    return name
-        return None
+        if md != md:  # NaN lies in no interval
+            return None
+        # tops are sorted, so the containing interval is the last top <= md
+        i = int(np.searchsorted(self._depth, md, side="right")) - 1
+        return self._formation[i] if i >= 0 else None
 
     def get_facecolor(self, name: str) -> Optional[str]:
         """Return the facecolor for `name`, if set; otherwise None."""
@@ -174,7 +175,7 @@ class Tops:
         Unknown formation keys are ignored.
         """
         for k, v in mapping.items():
-            if k in self._formation:
+            if k in self._index:
                 self._facecolor[k] = v
 
     def facecolor_map(self) -> Dict[str, Optional[str]]:
@@ -187,7 +188,7 @@ class Tops:
         Add a new formation top (name must not already exist). Keeps ordering by depth.
         Raises if name exists or depth is invalid.
         """
-        if name in self._formation:
+        if name in self._index:
             raise ValueError(f"Formation '{name}' already exists.")
         depth = float(depth)
         if not np.isfinite(depth) or depth < 0:
@@ -197,16 +198,18 @@ class Tops:
         insert_at = int(np.searchsorted(self._depth, depth, side="left"))
         self._formation.insert(insert_at, name)
         self._depth = np.insert(self._depth, insert_at, depth)
+        self._reindex()
         if facecolor is not None:
             self._facecolor[name] = facecolor
 
     def remove(self, name: str) -> None:
         """Remove a formation top by name (no-op if absent)."""
-        if name not in self._formation:
+        if name not in self._index:
             return
         i = self.index(name)
         self._formation.pop(i)
         self._depth = np.delete(self._depth, i, axis=0)
+        self._reindex()
         self._facecolor.pop(name, None)
 
     def rename(self, old: str, new: str) -> None:
@@ -214,10 +217,11 @@ class Tops:
         Rename a formation (case-sensitive). Fails if `new` already exists.
         Depth and facecolor are preserved.
         """
-        if new in self._formation:
+        if new in self._index:
             raise ValueError(f"Formation '{new}' already exists.")
         i = self.index(old)
         self._formation[i] = new
+        self._index[new] = self._index.pop(old)
         if old in self._facecolor:
             self._facecolor[new] = self._facecolor.pop(old)
 
@@ -17,6 +17,15 @@ from ._layout import Layout
 
 from ._rates import RateTable
 
+def _count(obj: Any, items: str) -> int:
+    """len() of a sub-object, or of its `items` attribute when it is not sized
+    (duck-typed stand-ins such as test stubs only carry the collection)."""
+    if not obj:
+        return 0
+    if hasattr(obj, "__len__"):
+        return len(obj)
+    return len(getattr(obj, items, ()))
+
 @dataclass(frozen=True, slots=True)
 class Well:
     """
@@ -173,8 +182,8 @@ class Well:
         """
         md_end = float(self.survey.MD[-1]) if (self.survey and getattr(self.survey, "MD", None) is not None) else None
         tvd_end = float(self.survey.TVD[-1]) if (self.survey and getattr(self.survey, "TVD", None) is not None) else None
-        tops_count = len(self.tops.formations) if self.tops else 0
-        perfs_count = len(getattr(self.perfs, "intervals", [])) if self.perfs and hasattr(self.perfs, "intervals") else 0
+        tops_count = _count(self.tops, "formations")
+        perfs_count = _count(self.perfs, "intervals")
         return {
             "name": self.name_text,
             "status": self.current_status_code(),
@@ -206,7 +215,7 @@ class Well:
             if isinstance(obj, Tops):
                 return {"formations": obj.formations}
             if isinstance(obj, PerfTable):
-                return {"count": len(getattr(obj, "intervals", []))}
+                return {"count": len(obj)}
             if isinstance(obj, Layout):
                 return {"type": "layout"}
             return str(obj)
@@ -267,10 +276,12 @@ class Well:
         # Example cross-check: tops must be within survey MD range if both present
         if self.survey and self.tops and getattr(self.survey, "MD", None) is not None:
             md_min, md_max = float(self.survey.MD[0]), float(self.survey.MD[-1])
-            for md in getattr(self.tops, "depths", []):
-                if md < md_min or md > md_max:
-                    # Soft rule—choose warning/log instead if you prefer
-                    raise ValueError(f"Top MD {md} outside survey range [{md_min}, {md_max}].")
+            depths = np.asarray(getattr(self.tops, "depths", ()), dtype=float)
+            outside = (depths < md_min) | (depths > md_max)
+            if outside.any():
+                # Soft rule—choose warning/log instead if you prefer
+                md = depths[outside.argmax()]
+                raise ValueError(f"Top MD {md} outside survey range [{md_min}, {md_max}].")
 
     @staticmethod
     def label(frame:pd.DataFrame,formation:str,field:str,current_date=None) -> pd.DataFrame:
@@ -1,3 +1,10 @@
+import os
+
+# Run numba-decorated kernels as plain Python by default so the suite skips
+# JIT warm-up; export NUMBA_DISABLE_JIT=0 and select `-m jit` to test the
+# compiled paths. Must be set before anything imports numba.
+os.environ.setdefault("NUMBA_DISABLE_JIT", "1")
+
 import shutil
 from contextlib import contextmanager
 from pathlib import Path
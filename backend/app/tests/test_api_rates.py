@@ -1,8 +1,12 @@
+import json
 import os
 import time
 
+import pandas as pd
 import pytest
 
+from backend.app.api import rates as rates_api
+
 
 def test_rates_default_sum(client):
     resp = client.get("/api/rates")
@@ -57,3 +61,216 @@ def test_rates_reload_on_file_change(sample_data_dir, client_factory):
         resp = client.get("/api/rates")
         assert resp.status_code == 200
         assert "2024-03-01" in resp.json()["date"]
+
+
+# ------------------------- Parquet mirror (RATES_CACHE_DIR) -------------------------
+
+def _bump_mtime(path, seconds=5):
+    new_mtime = time.time() + seconds
+    os.utime(path, (new_mtime, new_mtime))
+
+
+@pytest.fixture
+def mirror_dir(tmp_path, monkeypatch):
+    pytest.importorskip("pyarrow")
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv("RATES_CACHE_DIR", str(cache_dir))
+    return cache_dir
+
+
+def test_parquet_mirror_is_written_and_reused(sample_data_dir, mirror_dir, monkeypatch):
+    rates_path = sample_data_dir / "rates.csv"
+    first = rates_api._load_rates_csv(rates_path)
+    assert [p.name for p in mirror_dir.glob("*.parquet")] == [rates_api._parquet_cache_path(rates_path).name]
+
+    def _no_csv(path):
+        raise AssertionError("CSV re-parsed despite a valid mirror")
+
+    monkeypatch.setattr(rates_api, "_read_rates_csv", _no_csv)
+    second = rates_api._load_rates_csv(rates_path)
+    assert second["oil_rate"].tolist() == first["oil_rate"].tolist()
+
+
+def test_parquet_mirror_invalidated_and_pruned_on_stamp_change(sample_data_dir, mirror_dir):
+    rates_path = sample_data_dir / "rates.csv"
+    rates_api._load_rates_csv(rates_path)
+    old_mirror = rates_api._parquet_cache_path(rates_path)
+
+    with rates_path.open("a", encoding="utf-8") as handle:
+        handle.write("\n2024-03-01,C-03,PK,300,70,1200")
+    _bump_mtime(rates_path)
+
+    df = rates_api._load_rates_csv(rates_path)
+    assert "C-03" in df["well"].tolist()
+
+    new_mirror = rates_api._parquet_cache_path(rates_path)
+    assert new_mirror != old_mirror
+    assert sorted(mirror_dir.iterdir()) == [new_mirror]
+
+
+def test_corrupt_parquet_mirror_falls_back_to_csv(sample_data_dir, mirror_dir):
+    rates_path = sample_data_dir / "rates.csv"
+    rates_api._load_rates_csv(rates_path)
+    mirror = rates_api._parquet_cache_path(rates_path)
+    mirror.write_bytes(b"PAR1 truncated")
+
+    df = rates_api._load_rates_csv(rates_path)
+    assert len(df) == 5
+
+    # the mirror was rebuilt and is readable again
+    assert len(pd.read_parquet(mirror)) == 5
+
+
+# ------------------------------ response cache ------------------------------
+
+def _append_rate_row(rates_path, row):
+    with rates_path.open("a", encoding="utf-8") as handle:
+        handle.write("\n" + row)
+    _bump_mtime(rates_path)
+
+
+@pytest.fixture
+def empty_rates_cache(monkeypatch):
+    monkeypatch.setattr(rates_api, "_rates_cache", type(rates_api._rates_cache)())
+    return rates_api._rates_cache
+
+
+def test_rates_repeat_query_is_served_from_cache(client, empty_rates_cache, monkeypatch):
+    first = client.get("/api/rates", params={"well": "A-01"})
+    assert first.status_code == 200
+
+    def _no_recompute(*args, **kwargs):
+        raise AssertionError("repeat query recomputed instead of hitting the cache")
+
+    monkeypatch.setattr(rates_api, "get_rates", _no_recompute)
+    second = client.get("/api/rates", params={"well": "A-01"})
+    assert second.status_code == 200
+    assert second.content == first.content
+
+
+def test_rates_cache_invalidated_on_reload(sample_data_dir, client_factory, empty_rates_cache):
+    with client_factory(sample_data_dir) as client:
+        before = client.get("/api/rates")
+        assert "2024-03-01" not in before.text
+
+        _append_rate_row(sample_data_dir / "rates.csv", "2024-03-01,C-03,PK,300,70,1200")
+
+        after = client.get("/api/rates")
+        assert after.status_code == 200
+        assert "2024-03-01" in after.text
+
+
+def test_rates_cache_evicts_least_recently_used(client, empty_rates_cache, monkeypatch):
+    monkeypatch.setattr(rates_api, "RATES_CACHE_SIZE", 2)
+
+    for limit in (1, 2, 3):
+        assert client.get("/api/rates", params={"limit": limit}).status_code == 200
+
+    assert len(empty_rates_cache) == 2
+    assert [key[-1] for key in empty_rates_cache] == [2, 3]
+
+
+def test_rates_meta_recomputed_after_reload(sample_data_dir, client_factory, empty_rates_cache):
+    with client_factory(sample_data_dir) as client:
+        before = client.get("/api/rates/meta").json()
+        assert "C-03" not in before["categories"]["well"]
+
+        # served from the cache while the file is unchanged
+        assert client.get("/api/rates/meta").json() == before
+
+        _append_rate_row(sample_data_dir / "rates.csv", "2024-03-01,C-03,PK,300,70,1200")
+
+        after = client.get("/api/rates/meta").json()
+        assert "C-03" in after["categories"]["well"]
+        assert after["category_counts"]["well"] == before["category_counts"]["well"] + 1
+
+
+# ----------------------------- response encoding -----------------------------
+
+def _column_values(column):
+    # orient="columns" keys values by row label
+    return list(column.values()) if isinstance(column, dict) else list(column)
+
+
+def test_rates_body_matches_previous_json_encoding(sample_data_dir, client_factory, empty_rates_cache):
+    # a lone row with no oil rate makes mean() produce NaN for that date
+    _append_rate_row(sample_data_dir / "rates.csv", "2024-03-05,A-01,FLD,,50,1000")
+
+    with client_factory(sample_data_dir) as client:
+        params = {"agg": ["oil_rate:mean", "water_rate:sum"]}
+        resp = client.get("/api/rates", params=params)
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].split(";")[0] == "application/json"
+
+        # before the change the handler returned json.loads(get_rates(...))
+        # and FastAPI re-encoded it; the body must decode to the same payload
+        df = client.app.state.rates
+        expected = json.loads(
+            rates_api.get_rates(
+                df,
+                date_col="date",
+                agg_dict=rates_api._parse_agg_params(params["agg"], df),
+                default_days=rates_api.DEFAULT_LOOKBACK_DAYS,
+            )
+        )
+        data = resp.json()
+        assert data == expected
+
+        dates = _column_values(data["date"])
+        oil = _column_values(data["oil_rate"])
+        assert oil[dates.index("2024-03-05")] is None
+
+
+# ------------------------- loader dtypes (pyarrow / NumPy) -------------------------
+
+@pytest.fixture(params=[False, True], ids=["numpy", "pyarrow"])
+def reader_path(request, monkeypatch):
+    if request.param:
+        pytest.importorskip("pyarrow")
+    monkeypatch.setattr(rates_api, "_HAS_PYARROW", request.param)
+    monkeypatch.delenv("RATES_CACHE_DIR", raising=False)
+    return request.param
+
+
+@pytest.fixture
+def loaded_rates(reader_path, sample_data_dir):
+    return rates_api._load_rates_csv(sample_data_dir / "rates.csv")
+
+
+def test_loader_parses_dates_and_keeps_numeric_columns(loaded_rates):
+    assert loaded_rates["date"].dtype.kind == "M"
+    assert loaded_rates["date"].iloc[0] == pd.Timestamp("2024-01-01")
+    for col in ("oil_rate", "water_rate", "gas_rate"):
+        assert loaded_rates[col].dtype.kind in "if"
+
+
+def test_get_rates_filters_work_on_loaded_dtypes(loaded_rates):
+    data = json.loads(
+        rates_api.get_rates(
+            loaded_rates,
+            filter_dict={"well": ["A-01"], "field": ["FLD"]},
+            default_days=rates_api.DEFAULT_LOOKBACK_DAYS,
+        )
+    )
+    assert _column_values(data["date"]) == ["2024-01-01", "2024-01-02"]
+    assert _column_values(data["oil_rate"]) == pytest.approx([100.0, 120.0])
+
+
+def test_loader_tolerates_malformed_date_rows(reader_path, sample_data_dir):
+    rates_path = sample_data_dir / "rates.csv"
+    with rates_path.open("a", encoding="utf-8") as handle:
+        handle.write("\nnot-a-date,A-01,FLD,999,1,1")
+
+    df = rates_api._load_rates_csv(rates_path)
+    assert len(df) == 6
+
+    data = json.loads(
+        rates_api.get_rates(
+            df,
+            filter_dict={"well": ["A-01"]},
+            default_days=rates_api.DEFAULT_LOOKBACK_DAYS,
+        )
+    )
+    # the malformed row is dropped, the rest is unaffected
+    assert _column_values(data["date"]) == ["2024-01-01", "2024-01-02", "2024-01-03"]
+    assert 999 not in _column_values(data["oil_rate"])
@@ -1,5 +1,7 @@
 # test_survey.py
 # Run: pytest -q
+import sys
+
 import numpy as np
 import pytest
 
@@ -11,6 +13,27 @@ from wellx.items import Survey
 def arr(*xs):
     return np.asarray(xs, dtype=float)
 
+def frozen(*xs):
+    a = arr(*xs)
+    a.setflags(write=False)
+    return a
+
+# Shared 4-station inputs; read-only so a test cannot mutate them for others.
+MD_4    = frozen(0, 10, 20, 30)
+ZEROS_4 = frozen(0, 0, 0, 0)
+
+
+# ---------- Shared surveys ----------
+# Module-scoped: the tests below only read from these instances.
+@pytest.fixture(scope="module")
+def vertical_survey_small():
+    return Survey.from_md_tvd(arr(0, 10, 20), arr(0, 9, 18))
+
+@pytest.fixture(scope="module")
+def vertical_survey_large():
+    md = np.linspace(0.0, 100.0, 101)
+    return Survey.from_md_tvd(md, md.copy())
+
 
 # ---------- Fields / construction ----------
 def test_fields_have_expected_names():
@@ -19,25 +42,33 @@ def test_fields_have_expected_names():
         assert name in f
 
 def test_from_md_tvd_basic_and_view_section():
-    md  = arr(0, 10, 20, 30)
+    md  = MD_4
     tvd = arr(0,  9, 19, 28)
     s = Survey.from_md_tvd(md, tvd)
     md2, tvd2 = s.view_section()
     assert np.allclose(md2, md)
     assert np.allclose(tvd2, tvd)
 
-def test_constructor_enforces_md_strictly_increasing():
+@pytest.mark.parametrize(
+    "md,tvd",
+    [
+        (arr(0, 10, 10), arr(0, 9, 18)),  # MD not strictly increasing
+        (arr(0, 10, 20), arr(0, 9)),      # lengths differ
+    ],
+    ids=["md_not_increasing", "shape_mismatch"],
+)
+def test_constructor_validation_raises(md, tvd):
     with pytest.raises(ValueError):
-        Survey.from_md_tvd(arr(0, 10, 10), arr(0, 9, 18))
+        Survey.from_md_tvd(md, tvd)
 
-def test_shape_mismatch_raises():
+def test_direct_constructor_rejects_shape_mismatch():
     with pytest.raises(ValueError):
         Survey(MD=arr(0, 10, 20), TVD=arr(0, 9))  # lengths differ
 
 
 # ---------- Interpolation ----------
 def test_md2tvd_and_tvd2md_roundtrip_within_range():
-    md  = arr(0, 10, 20, 30)
+    md  = MD_4
     tvd = arr(0,  8, 18, 27)
     s = Survey.from_md_tvd(md, tvd)
 
@@ -47,8 +78,8 @@ def test_md2tvd_and_tvd2md_roundtrip_within_range():
     back_md = s.tvd2md(got_tvd)
     assert np.allclose(back_md, q_md)
 
-def test_md2tvd_raises_out_of_range():
-    s = Survey.from_md_tvd(arr(0, 10, 20), arr(0, 9, 18))
+def test_md2tvd_raises_out_of_range(vertical_survey_small):
+    s = vertical_survey_small
     with pytest.raises(ValueError):
         s.md2tvd(arr(-1, 5))  # -1 is below range
     with pytest.raises(ValueError):
@@ -62,19 +93,22 @@ def test_tvd2md_requires_increasing_tvd():
 
 
 # ---------- Geometry helpers ----------
+@pytest.mark.jit
 def test_inc2tvd_vertical_equals_md():
-    md = arr(0, 10, 20, 30)
-    inc = arr(0, 0, 0, 0)  # vertical
+    md = MD_4
+    inc = ZEROS_4  # vertical
     tvd = Survey.inc2tvd(inc, md)
     assert np.allclose(tvd, md)
 
+@pytest.mark.jit
 def test_off2tvd_no_lateral_equals_md_increment():
-    md  = arr(0, 10, 20, 30)
-    dx  = arr(0, 0, 0, 0)
-    dy  = arr(0, 0, 0, 0)
+    md  = MD_4
+    dx  = ZEROS_4
+    dy  = ZEROS_4
     tvd = Survey.off2tvd(md, dx, dy)
     assert np.allclose(tvd, md)
 
+@pytest.mark.jit
 def test_off2tvd_handles_large_lateral_without_crash():
     # Construct intervals where lateral is close to MD (valid geometry)
     md = arr(0, 10, 20)
@@ -87,11 +121,80 @@ def test_off2tvd_handles_large_lateral_without_crash():
     assert tvd[-1] > 0.0
 
 
+# ---------- Kernels: compiled and pure-Python bodies ----------
+# Each kernel is checked once through numba (when it is compiled) and once
+# through its `.py_func`, so coverage and compiled correctness share one run.
+def _jit_disabled():
+    # under NUMBA_DISABLE_JIT njit still returns a wrapper with .py_func, but
+    # calling it runs the plain Python body, so there is nothing compiled to test
+    numba = sys.modules.get("numba")
+    return numba is None or bool(numba.config.DISABLE_JIT)
+
+def _kernel(name, mode):
+    fn = vars(sys.modules[Survey.__module__])[name]
+    if mode == "py":
+        return getattr(fn, "py_func", fn)
+    if not hasattr(fn, "py_func") or _jit_disabled():
+        pytest.skip("numba kernels are not compiled in this run")
+    return fn
+
+KERNEL_MODES = [pytest.param("jit", marks=pytest.mark.jit), "py"]
+
+@pytest.fixture(params=KERNEL_MODES)
+def inc2tvd_kernel(request):
+    return _kernel("_inc2tvd", request.param)
+
+@pytest.fixture(params=KERNEL_MODES)
+def off2tvd_kernel(request):
+    return _kernel("_off2tvd", request.param)
+
+def test_inc2tvd_kernel_vertical_equals_md(inc2tvd_kernel):
+    md = MD_4
+    assert np.allclose(inc2tvd_kernel(md, ZEROS_4), md)
+
+def test_inc2tvd_kernel_matches_cosine_steps(inc2tvd_kernel):
+    md  = arr(0, 10, 20)
+    inc = arr(0, 60, 60)
+    assert np.allclose(inc2tvd_kernel(md, inc), arr(0, 5, 10))
+
+def test_off2tvd_kernel_no_lateral_equals_md(off2tvd_kernel):
+    assert np.allclose(off2tvd_kernel(MD_4, ZEROS_4, ZEROS_4), MD_4)
+
+def test_off2tvd_kernel_clamps_impossible_segments(off2tvd_kernel):
+    # lateral step longer than the MD step -> that segment adds no TVD
+    md = arr(0, 10, 20)
+    dx = arr(0, 20, 20)
+    dy = arr(0,  0,  0)
+    assert np.allclose(off2tvd_kernel(md, dx, dy), arr(0, 0, 10))
+
+
+# ---------- NumPy fallback path ----------
+# With numba installed the public methods always dispatch to the kernels, so
+# the fused NumPy branch is forced here by hiding `njit` from the module.
+@pytest.fixture
+def numpy_path(monkeypatch):
+    monkeypatch.setattr(sys.modules[Survey.__module__], "njit", None)
+
+# non-zero first station so an offset mistake in either path shows up
+MD_5  = frozen(100, 110, 125, 140, 160)
+INC_5 = frozen(0, 5, 30, 60, 89)
+DX_5  = frozen(0, 1, 6, 20, 35)
+DY_5  = frozen(0, 2, 5, 5, 40)
+
+def test_inc2tvd_numpy_path_matches_kernel(numpy_path):
+    expected = _kernel("_inc2tvd", "py")(MD_5, INC_5)
+    assert np.allclose(Survey.inc2tvd(INC_5, MD_5), expected)
+
+def test_off2tvd_numpy_path_matches_kernel(numpy_path):
+    expected = _kernel("_off2tvd", "py")(MD_5, DX_5, DY_5)
+    assert np.allclose(Survey.off2tvd(MD_5, DX_5, DY_5), expected)
+
+
 # ---------- Minimum curvature & constructors ----------
 def test_minimum_curvature_vertical_path():
-    md  = arr(0, 10, 20, 30)
-    inc = arr(0, 0, 0, 0)
-    azi = arr(0, 0, 0, 0)
+    md  = MD_4
+    inc = ZEROS_4
+    azi = ZEROS_4
     dx, dy, tvd = Survey.minimum_curvature(md, inc, azi, xhead=100.0, yhead=200.0, datum=5.0)
     assert np.allclose(dx, 100.0)  # no east movement
     assert np.allclose(dy, 200.0)  # no north movement
@@ -108,17 +211,16 @@ def test_from_md_inc_azi_constructor_and_views():
     M, Z = s.view_section()
     assert len(X) == len(Y) == len(M) == len(Z) == 3
 
-def test_view_plan_requires_dx_dy():
-    s = Survey.from_md_tvd(arr(0, 10, 20), arr(0, 9, 18))
+def test_view_plan_requires_dx_dy(vertical_survey_small):
+    s = vertical_survey_small
     with pytest.raises(ValueError):
         s.view_plan()
 
 
 # ---------- Downsampling ----------
-def test_downsample_reduces_points_and_preserves_endpoints():
-    md  = np.linspace(0.0, 100.0, 101)
-    tvd = md.copy()
-    s = Survey.from_md_tvd(md, tvd)
+def test_downsample_reduces_points_and_preserves_endpoints(vertical_survey_large):
+    s = vertical_survey_large
+    md, tvd = s.MD, s.TVD
     downs = s.downsample(max_points=5)
     # downs returns tuple skipping None -> here (MD, TVD)
     md_d, tvd_d = downs
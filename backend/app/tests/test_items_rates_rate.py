@@ -6,10 +6,26 @@ import pytest
 # e.g., from mypkg.rate import Rate
 from wellx.items import Rate
 
+# resolved once for the module; Rate's field list is fixed at class definition
+_FIELDS = Rate.fields()
+
+# ---------- shared instances
+
+@pytest.fixture(scope="module")
+def default_rate():
+    """Read-only default Rate shared by the tests that never mutate it."""
+    return Rate(well="A-12", date=dt.date(2025, 8, 17))
+
+
+@pytest.fixture
+def mutable_rate():
+    """Fresh default Rate for tests that set unit overrides."""
+    return Rate(well="A-12", date=dt.date(2025, 8, 17))
+
 # ---------- construction & defaults
 
-def test_valid_init_with_defaults():
-    r = Rate(well="A-12", date=dt.date(2025, 8, 17))
+def test_valid_init_with_defaults(default_rate):
+    r = default_rate
     assert r.well == "A-12"
     assert r.days == 0
     assert r.horizon is None
@@ -37,38 +53,30 @@ def test_none_rates_are_normalized_to_zero():
 
 # ---------- invariants & validation
 
-@pytest.mark.parametrize("bad", ["", "   "])
-def test_invalid_well_raises(bad):
-    with pytest.raises(ValueError, match="well must be a non-empty string"):
-        Rate(well=bad, date=dt.date(2025, 8, 17))
-
-
-def test_invalid_date_type_raises():
-    with pytest.raises(TypeError, match="date must be a datetime\\.date"):
-        Rate(well="A-12", date="2025-08-17")  # type: ignore[arg-type]
-
-
-def test_invalid_otype_raises():
-    with pytest.raises(ValueError, match="otype must be 'production' or 'injection'"):
-        Rate(well="A-12", date=dt.date(2025, 8, 17), otype="test")  # type: ignore[arg-type]
-
-
-def test_negative_days_raises():
-    with pytest.raises(ValueError, match="days must be >= 0"):
-        Rate(well="A-12", date=dt.date(2025, 8, 17), days=-1)
-
-
-@pytest.mark.parametrize("field_name", ["orate", "wrate", "grate"])
-def test_negative_rate_raises(field_name):
-    kwargs = dict(well="A-12", date=dt.date(2025, 8, 17), orate=0.0, wrate=0.0, grate=0.0)
-    kwargs[field_name] = -0.1
-    with pytest.raises(ValueError, match=f"{field_name} must be >= 0"):
-        Rate(**kwargs)
-
-
-def test_negative_choke_raises():
-    with pytest.raises(ValueError, match="choke must be >= 0"):
-        Rate(well="A-12", date=dt.date(2025, 8, 17), choke=-1.0)
+_BASE = dict(well="A-12", date=dt.date(2025, 8, 17))
+
+
+@pytest.mark.parametrize(
+    "override,exc,pattern",
+    [
+        ({"well": ""},            ValueError, "well must be a non-empty string"),
+        ({"well": "   "},         ValueError, "well must be a non-empty string"),
+        ({"date": "2025-08-17"},  TypeError,  "date must be a datetime\\.date"),
+        ({"otype": "test"},       ValueError, "otype must be 'production' or 'injection'"),
+        ({"days": -1},            ValueError, "days must be >= 0"),
+        ({"choke": -1.0},         ValueError, "choke must be >= 0"),
+        ({"orate": -0.1},         ValueError, "orate must be >= 0"),
+        ({"wrate": -0.1},         ValueError, "wrate must be >= 0"),
+        ({"grate": -0.1},         ValueError, "grate must be >= 0"),
+    ],
+    ids=[
+        "empty_well", "blank_well", "str_date", "bad_otype", "negative_days",
+        "negative_choke", "negative_orate", "negative_wrate", "negative_grate",
+    ],
+)
+def test_invalid_construction_raises(override, exc, pattern):
+    with pytest.raises(exc, match=pattern):
+        Rate(**{**_BASE, **override})
 
 
 # ---------- convenience properties
@@ -95,15 +103,15 @@ def test_shutin_false_when_has_rates_and_days_positive():
 
 # ---------- unit metadata access & overrides
 
-def test_get_unit_returns_metadata_default():
-    r = Rate(well="A-12", date=dt.date(2025, 8, 17))
+def test_get_unit_returns_metadata_default(default_rate):
+    r = default_rate
     assert r.get_unit("orate") == "STB/d"
     assert r.get_unit("wrate") == "STB/d"
     assert r.get_unit("grate") == "MSCF/d"
 
 
-def test_set_unit_overrides_take_precedence():
-    r = Rate(well="A-12", date=dt.date(2025, 8, 17))
+def test_set_unit_overrides_take_precedence(mutable_rate):
+    r = mutable_rate
     r.set_unit(orate="m3/d", grate="Sm3/d")
     assert r.get_unit("orate") == "m3/d"
     assert r.get_unit("grate") == "Sm3/d"
@@ -111,14 +119,14 @@ def test_set_unit_overrides_take_precedence():
     assert r.get_unit("wrate") == "STB/d"
 
 
-def test_get_unit_unknown_field_raises():
-    r = Rate(well="A-12", date=dt.date(2025, 8, 17))
+def test_get_unit_unknown_field_raises(default_rate):
+    r = default_rate
     with pytest.raises(AttributeError, match="No field named 'xyz'"):
         r.get_unit("xyz")
 
 
-def test_set_unit_unknown_field_raises():
-    r = Rate(well="A-12", date=dt.date(2025, 8, 17))
+def test_set_unit_unknown_field_raises(mutable_rate):
+    r = mutable_rate
     with pytest.raises(AttributeError, match="No field named 'xyz'"):
         r.set_unit(xyz="m3/d")  # type: ignore[call-arg]
 
@@ -126,7 +134,7 @@ def test_set_unit_unknown_field_raises():
 # ---------- fields() helper
 
 def test_fields_returns_stable_field_names_in_order():
-    names = Rate.fields()
+    names = _FIELDS
     # Must contain all declared dataclass fields in their definition order
     # (including private one `_unit_override`)
     expected_subset = [
@@ -16,4 +16,9 @@ def d(y, m, day):
 def test_fields_schema():
     assert RateTable.fields() == [
         "well", "date", "days", "horizon", "otype", "choke", "orate", "wrate", "grate"
-    ]
\ No newline at end of file
+    ]
+
+def test_default_units_are_read_only():
+    assert RateTable.DEFAULT_UNITS["orate"] == "STB/d"
+    with pytest.raises(TypeError):
+        RateTable.DEFAULT_UNITS["orate"] = "m3/d"
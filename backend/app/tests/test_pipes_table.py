@@ -2,37 +2,41 @@ import pandas as pd
 import numpy as np
 import pytest
 
-from typing import Tuple
-
 from wellx.pipes import Table
 
-@pytest.fixture
+# already typed as datetime64[ns]; DataFrame takes it without re-parsing
+_DATES = np.array(["2024-01-01", "2024-01-02", "2024-01-03", "2024-01-04"], dtype="datetime64[ns]")
+
+# base_df, tiein and sample_df are built once per module and must not be
+# mutated by tests; tf hands each test its own copy.
+@pytest.fixture(scope="module")
 def base_df() -> pd.DataFrame:
     return pd.DataFrame(
         {
             "tarix": [1, 2, 3, 4],  # int
             "qoil": [10.0, 11.5, 9.7, 12.0],  # float
             "name": ["A", "B", "C", "A"],  # object
-            "when": pd.to_datetime(["2024-01-01", "2024-01-02", "2024-01-03", "2024-01-04"]),
+            "when": _DATES,
         }
     )
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def tiein() -> dict:
     return {"date": "tarix", "orate": "qoil"}
 
 @pytest.fixture
 def tf(base_df, tiein) -> Table:
-    return Table(base_df, tiein=tiein)
+    return Table(base_df.copy(), tiein=dict(tiein))
 
 
 # ------------------------------- Attribute access ----------------------------
 
-def test_tiein_attribute_returns_mapped_column(tf: Table, base_df: pd.DataFrame):
+def test_tiein_attribute_returns_mapped_column(tf: Table):
     s = tf.date
     assert isinstance(s, pd.Series)
     assert s.name == "tarix"
-    pd.testing.assert_series_equal(s, base_df["tarix"])
+    # alias access is a zero-copy view of the mapped column
+    assert np.shares_memory(s.to_numpy(), tf["tarix"].to_numpy())
 
 def test_attribute_mapped_but_missing_column_raises(base_df):
     t = Table(base_df[["qoil"]].copy(), tiein={"orate": "qoil", "date": "tarix"})
@@ -41,12 +45,20 @@ def test_attribute_mapped_but_missing_column_raises(base_df):
 
 def test_fallback_attribute_to_existing_column(tf: Table):
     s = tf.qoil  # not in tiein; should still work
-    pd.testing.assert_series_equal(s, tf["qoil"])
+    assert s.name == "qoil"
+    assert np.shares_memory(s.to_numpy(), tf["qoil"].to_numpy())
 
 def test_unknown_attribute_raises(tf: Table):
     with pytest.raises(AttributeError):
         _ = tf.not_a_real_attr
 
+def test_private_names_are_not_resolved_as_columns(base_df):
+    t = Table(base_df.rename(columns={"qoil": "_qoil"}), tiein={"_orate": "_qoil"})
+    with pytest.raises(AttributeError):
+        _ = t._qoil
+    with pytest.raises(AttributeError):
+        _ = t._orate
+
 
 # ----------------------------- __getitem__ behavior --------------------------
 
@@ -77,19 +89,17 @@ def test_child_tiein_mutation_does_not_affect_parent(tf: Table):
 
 # ----------------------------- dtype-based properties ------------------------
 
-def test_datetimes_returns_datetime_columns_as_set(tf: Table):
-    # utils.heads uses set() internally → order not guaranteed; compare as sets
-    out = set(tf.datetimes)
-    assert out == {"when"}
+# get_heads keeps frame column order, so the views are compared as lists
 
-def test_numbers_returns_numeric_columns_as_set(tf: Table):
-    out = set(tf.numbers)
+def test_datetimes_returns_datetime_columns(tf: Table):
+    assert tf.datetimes == ["when"]
+
+def test_numbers_returns_numeric_columns(tf: Table):
     # 'number' should include ints and floats (not objects)
-    assert out == {"tarix", "qoil"}
+    assert tf.numbers == ["tarix", "qoil"]
 
 def test_nominals_excludes_numbers_and_datetimes(tf: Table):
-    out = set(tf.nominals)
-    assert out == {"name"}
+    assert tf.nominals == ["name"]
 
 
 # ----------------------------- Construction / docstring ----------------------
@@ -105,7 +115,7 @@ def test_docstring_example_equivalence():
     assert pytest.approx(tf.orate.mean()) == 10.4
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_df() -> pd.DataFrame:
     # columns: strings, ints, floats, bools, datetimes
     return pd.DataFrame({
@@ -114,7 +124,7 @@ def sample_df() -> pd.DataFrame:
         "age":  [10, 20, 30, 40],              # int
         "score": [1.5, 2.0, 3.5, 4.0],         # float
         "is_ok": [True, False, True, True],    # bool
-        "date": pd.to_datetime(["2024-01-01","2024-01-02","2024-01-03","2024-01-04"])
+        "date": _DATES
     })
 
 # ------------------------- tests for heads -----------------------------
@@ -124,24 +134,28 @@ def test_heads_args_only_preserves_arg_order(sample_df):
     assert out == ["city", "age", "name"]  # missing is dropped
 
 @pytest.mark.parametrize(
-    "include,exclude,expected_subset",
+    "include,exclude,expected",
     [
-        (("int64","float64"), None, {"age","score"}),
-        (("bool",), None, {"is_ok"}),
-        (("datetime64[ns]",), None, {"date"}),
-        (None, ("int64",), set(sample_df().__class__ if False else ["name","city","score","is_ok","date"]) - {"age"}),  # just to vary
-    ]
+        (("int64","float64"), None, ["age","score"]),
+        (("bool",), None, ["is_ok"]),
+        (("datetime64[ns]",), None, ["date"]),
+        (None, ("int64",), ["name","city","score","is_ok","date"]),
+    ],
+    ids=["ints_floats", "bools", "datetimes", "exclude_ints"],
 )
-def test_heads_with_dtypes_returns_unordered_superset(sample_df, include, exclude, expected_subset):
-    # We assert set containment because heads() uses set() losing order.
-    out = set(Table.get_heads(sample_df, include=include, exclude=exclude))
-    assert expected_subset.issubset(out)
+def test_heads_with_dtypes_keeps_frame_order(sample_df, include, exclude, expected):
+    # dtype-selected columns come back in frame column order
+    assert Table.get_heads(sample_df, include=include, exclude=exclude) == expected
 
 
 def test_heads_combines_args_and_dtype_selection(sample_df):
-    out = set(Table.get_heads(sample_df, "name", include=("float64",)))
-    # should contain 'name' and any float columns
-    assert {"name","score"}.issubset(out)
+    # args first, then the dtype-selected columns in frame order
+    out = Table.get_heads(sample_df, "city", include=("int64","float64"))
+    assert out == ["city", "age", "score"]
+
+def test_heads_deduplicates_args_and_dtype_selection(sample_df):
+    out = Table.get_heads(sample_df, "score", include=("int64","float64"))
+    assert out == ["score", "age"]
 
 # -------------------------- tests for join ----------------------------
 
@@ -152,18 +166,12 @@ def test_join_with_args_only_preserves_order_and_builds_name(sample_df):
     assert df.iloc[0,0] == "A-X"
     assert df.iloc[1,0] == "B-Y"
 
-def test_join_with_dtype_filters_ignores_order(sample_df):
-    # include floats and ints; result column order is non-deterministic; validate content per row
+def test_join_with_dtype_filters_uses_frame_order(sample_df):
+    # include floats and ints; get_heads returns them in frame column order
     df = Table.join_columns(sample_df, include=("int64","float64"), sep="|")
-    # Retrieve the produced column name and split to see which columns were used
-    produced_col = df.columns[0]
-    used_cols = set(produced_col.split("|"))
-    assert used_cols == {"age","score"}  # both numeric columns must be used
-
-    # Validate row-wise joining independent of order
-    def parts(value): return set(str(value).split("|"))
-    assert parts(df.iloc[0,0]) == {"10","1.5"}
-    assert parts(df.iloc[2,0]) == {"30","3.5"}
+    assert list(df.columns) == ["age|score"]
+    assert df.iloc[0,0] == "10|1.5"
+    assert df.iloc[2,0] == "30|3.5"
 
 def test_join_default_separator_is_space(sample_df):
     df = Table.join_columns(sample_df, "name", "city")
@@ -194,8 +202,8 @@ def test_groupsum_sums_numeric_and_drops_group_label(sample_df):
     expected_cols = {"age","score"}  # bool will not be summed as ints (True=1, False=0)
     assert set(out.columns) >= expected_cols
     assert len(out) == 1
-    assert out.loc[0,"age"] == 70
-    assert out.loc[0,"score"] == pytest.approx(7.5)
+    row = out[["age","score"]].to_numpy()[0]
+    np.testing.assert_allclose(row, [70.0, 7.5])
     # original grouping column should not be present
     assert "name" not in out.columns
 
@@ -211,4 +219,28 @@ def test_groupsum_on_empty_filter_returns_empty(sample_df):
     # groupby on empty -> remains empty after sum/reset
     assert out.empty
     # columns should be the numeric ones (pandas sum on empty preserves dtypes/columns)
-    # but exact behavior can vary; at least shouldn't raise
\ No newline at end of file
+    # but exact behavior can vary; at least shouldn't raise
+
+
+# --------------------------------- jit_agg -----------------------------------
+
+@pytest.mark.parametrize("how", ["sum", "mean", "min", "max", "std"])
+def test_jit_agg_matches_pandas_reduction(tf: Table, how):
+    tf.loc[1, "qoil"] = np.nan
+    expected = getattr(tf["qoil"], how)()
+    assert tf.jit_agg("orate", how) == pytest.approx(expected)
+    assert tf.jit_agg("qoil", how) == pytest.approx(expected)
+
+def test_jit_agg_all_nan_column():
+    t = Table(pd.DataFrame({"q": [np.nan, np.nan]}))
+    assert t.jit_agg("q", "sum") == 0.0
+    assert np.isnan(t.jit_agg("q", "mean"))
+
+def test_jit_agg_rejects_unknown_reduction(tf: Table):
+    with pytest.raises(ValueError, match="Unknown reduction"):
+        tf.jit_agg("orate", "median")
+
+def test_jit_agg_without_tiein_metadata(base_df):
+    t = Table(base_df.copy())
+    object.__delattr__(t, "_tiein")  # as on frames pandas builds internally
+    assert t.jit_agg("qoil", "sum") == pytest.approx(base_df["qoil"].sum())
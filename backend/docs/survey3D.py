@@ -1,3 +1,5 @@
+from math import cos, sin, radians
+
 import numpy as np
 import plotly.graph_objects as go
 
@@ -6,14 +8,15 @@ depth = np.linspace(0, 3000, 50)
 
 def make_traj(x0, y0, azim_deg, kick_off=1000, build_rate=3):
     x, y, z = [x0], [y0], [0]
+    ang = radians(azim_deg)
+    c, s = cos(ang), sin(ang)
     for d in depth[1:]:
         if d < kick_off:
             x.append(x0); y.append(y0)
         else:
-            ang = np.radians(azim_deg)
             step = (d - kick_off)/200 * build_rate
-            x.append(x0 + step*np.cos(ang))
-            y.append(y0 + step*np.sin(ang))
+            x.append(x0 + step*c)
+            y.append(y0 + step*s)
         z.append(d)
     return np.array(x), np.array(y), np.array(z)
 
@@ -24,18 +27,26 @@ wells = {
 }
 
 # --- Find minimum distances ---
-def min_dist(w1, w2):
-    x1,y1,z1 = w1; x2,y2,z2 = w2
-    dmin = 1e9; pair = None
-    for i in range(len(z1)):
-        for j in range(len(z2)):
-            d = np.sqrt((x1[i]-x2[j])**2 + (y1[i]-y2[j])**2 + (z1[i]-z2[j])**2)
-            if d < dmin:
-                dmin = d; pair = (x1[i],y1[i],z1[i], x2[j],y2[j],z2[j])
-    return dmin, pair
+names = list(wells)
+traj = np.stack([np.column_stack(wells[n]) for n in names])  # (K, D, 3)
+
+def all_pairs_min_dist(traj):
+    """Closest approach between every pair of trajectories in one broadcast."""
+    K, D, _ = traj.shape
+    diff = traj[:, None, :, None, :] - traj[None, :, None, :, :]  # (K, K, D, D, 3)
+    d2 = np.einsum("abijk,abijk->abij", diff, diff).reshape(K, K, -1)
+    flat = d2.argmin(-1)
+    i, j = np.divmod(flat, D)
+    dmin = np.sqrt(np.take_along_axis(d2, flat[..., None], -1)[..., 0])
+    return dmin, i, j
+
+dmin, imin, jmin = all_pairs_min_dist(traj)
 
-pairs = [("Well-A","Well-B"), ("Well-A","Well-C"), ("Well-B","Well-C")]
-closest = {p: min_dist(wells[p[0]], wells[p[1]]) for p in pairs}
+closest = {}
+for a in range(len(names)):
+    for b in range(a+1, len(names)):
+        i, j = imin[a, b], jmin[a, b]
+        closest[(names[a], names[b])] = (dmin[a, b], (*traj[a, i], *traj[b, j]))
 
 # --- Build 3D figure ---
 fig = go.Figure()
@@ -1,14 +1,6 @@
-import numpy as np
 import pandas as pd
-import itertools
-import plotly.graph_objects as go
-import plotly.express as px
-import plotly.io as pio
-import argparse
 from pathlib import Path
 
-from wellx import Well
-
 def load_surveys(path: str, sheet: str | None = None, colmap: dict | None = None) -> pd.DataFrame:
 	"""
 	Load well survey table from CSV or Excel.
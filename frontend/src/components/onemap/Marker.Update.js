@@ -1,6 +1,43 @@
 import { fetchWells } from "@api/fetch.wells.js";
 import { SessionState } from "./Session.State.js";
 
+const WELL_MARKER_STYLE = Object.freeze({
+  bubblingMouseEvents: true,
+  color: "#CC5500",
+  dashArray: null,
+  dashOffset: null,
+  fill: true,
+  fillColor: "#CC5500",
+  fillOpacity: 1.,
+  fillRule: "evenodd",
+  lineCap: "round",
+  lineJoin: "round",
+  opacity: 1.0,
+  radius: 4,
+  weight: 1,
+  stroke: true,
+});
+
+// Wells are drawn on one shared canvas (per layer group) instead of one SVG
+// path per marker.
+const wellRenderers = new WeakMap();
+const getWellRenderer = (group) => {
+  let renderer = wellRenderers.get(group);
+  if (!renderer) {
+    renderer = L.canvas({ padding: 0.5 });
+    wellRenderers.set(group, renderer);
+  }
+  return renderer;
+};
+
+const escapeHtml = (value) =>
+  String(value ?? "")
+    .replace(/&/g, "&amp;")
+    .replace(/</g, "&lt;")
+    .replace(/>/g, "&gt;")
+    .replace(/"/g, "&quot;")
+    .replace(/'/g, "&#39;");
+
 const getLayerGroup = () => {
   if (typeof window !== "undefined" && window.wellPointFeatureGroup) {
     return window.wellPointFeatureGroup;
@@ -8,33 +45,83 @@ const getLayerGroup = () => {
   return null;
 };
 
+// Feature collections for recently viewed (horizon, time) selections, so
+// stepping back and forth on the time slider does not refetch and rebuild.
+// Entries expire after FEATURE_CACHE_TTL_MS so wells reloaded by the backend
+// (e.g. after a restart with new data) show up without a page reload.
+const FEATURE_CACHE_LIMIT = 8;
+const FEATURE_CACHE_TTL_MS = 60_000;
+const featureCache = new Map();
+
+function buildWellFeatures(wells) {
+  const features = [];
+  for (const { well, horizon, spud_date, lat: rawLat, lon: rawLon } of wells) {
+    const lat = Number(rawLat);
+    const lon = Number(rawLon);
+    if (!Number.isFinite(lat) || !Number.isFinite(lon)) continue;
+
+    features.push({
+      type: "Feature",
+      geometry: { type: "Point", coordinates: [lon, lat] },
+      properties: { well, horizon, spud_date, searchKey: well },
+    });
+  }
+  return features;
+}
+
+function loadWellFeatures(horizon, time) {
+  const key = `${horizon ?? ""}|${time ?? ""}`;
+  const now = Date.now();
+  let entry = featureCache.get(key);
+  if (entry) {
+    featureCache.delete(key);
+    if (now - entry.fetchedAt > FEATURE_CACHE_TTL_MS) entry = null;
+  }
+  if (!entry) {
+    const pending = fetchWells(horizon, time).then(buildWellFeatures);
+    entry = { pending, fetchedAt: now };
+    pending.catch(() => {
+      if (featureCache.get(key) === entry) featureCache.delete(key);
+    });
+    if (featureCache.size >= FEATURE_CACHE_LIMIT) {
+      featureCache.delete(featureCache.keys().next().value);
+    }
+  }
+  featureCache.set(key, entry);
+  return entry.pending;
+}
+
 export async function updateMap(layerGroup) {
   const targetGroup = layerGroup ?? getLayerGroup();
   if (!targetGroup) {
     throw new Error("wellPointFeatureGroup is not initialized");
   }
 
-  const wells = await fetchWells(SessionState.horizon, SessionState.time);
-  // convert them to markers
+  const features = await loadWellFeatures(SessionState.horizon, SessionState.time);
+
+  // horizons repeat across nearly every well; escape each distinct one once
+  const escapedHorizons = new Map();
+  const escapeHorizon = (horizon) => {
+    let escaped = escapedHorizons.get(horizon);
+    if (escaped === undefined) {
+      escaped = escapeHtml(horizon);
+      escapedHorizons.set(horizon, escaped);
+    }
+    return escaped;
+  };
+
+  const popupContent = (layer) => {
+    const { well, horizon, spud_date } = layer.feature.properties;
+    return `${escapeHtml(well)} (${escapeHorizon(horizon)})<br>Spud: ${escapeHtml(spud_date)}`;
+  };
+
+  const markerOptions = { ...WELL_MARKER_STYLE, renderer: getWellRenderer(targetGroup) };
+
+  // one GeoJSON layer for the whole well set instead of a layer per well
   targetGroup.clearLayers();
-  wells.forEach(w => {
-    L.circleMarker([w.lat, w.lon], {
-      bubblingMouseEvents: true,
-			color: '#CC5500',
-			dashArray: null,
-			dashOffset: null,
-			fill: true,
-			fillColor: '#CC5500',
-			fillOpacity: 1.,
-			fillRule: "evenodd",
-			lineCap: "round",
-			lineJoin: "round",
-			opacity: 1.0,
-			radius: 4,
-			weight: 1,
-			stroke: true,
-    })
-    .bindPopup(`${w.well} (${w.horizon})<br>Spud: ${w.spud_date}`)
-    .addTo(targetGroup);
-  });
+  L.geoJSON({ type: "FeatureCollection", features }, {
+    pointToLayer: (feature, latlng) => L.circleMarker(latlng, markerOptions),
+    // popup markup is only assembled when a popup is actually opened
+    onEachFeature: (feature, layer) => layer.bindPopup(popupContent),
+  }).addTo(targetGroup);
 }
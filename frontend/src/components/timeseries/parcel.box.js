@@ -342,7 +342,7 @@ function getTraceData(data, key) {
         x: toSeriesArray(payload.date),
         y: toSeriesArray(payload[key]),
         mode: "lines",
-        type: "scatter",
+        type: "scattergl", // WebGL: long daily rate histories stay responsive
     };
 }
 
@@ -368,6 +368,7 @@ function setTrace(box, data) {
         x: data.x,
         y: data.y,
         mode: data.mode,
+        type: data.type,
         yaxis: ref,
     };
     const key = ref === "y" ? "yaxis" : `yaxis${ref.slice(1)}`;
@@ -5,70 +5,52 @@ from bokeh.models import LinearAxis
 
 from bokeh.plotting import figure
 
-def boot(layout):
-
-	heads,bodys = [],[]
-
-	for index in range(layout.trail):
-
-		head = figure(width=layout.width[index],height=layout.height[0])
-		body = figure(width=layout.width[index],height=layout.height[1])
+# Shared axis styling; applied once per axis instead of property by property.
+AXIS_STYLE = dict(
+	major_label_text_font_size = '0pt',
+	major_tick_in = 0,
+	major_tick_out = 0,
+	minor_tick_in = 0,
+	minor_tick_out = 0,
+	)
 
-		head.add_layout(LinearAxis(major_label_text_alpha=0),'right')
-		head.add_layout(LinearAxis(major_label_text_alpha=0),'above')
+def styled(plot):
+	"""Styles the default axes and adds the hidden right/above axes."""
 
-		body.add_layout(LinearAxis(major_label_text_alpha=0),'right')
-		body.add_layout(LinearAxis(major_label_text_alpha=0),'above')
+	for axis in (*plot.below,*plot.left):
+		axis.update(**AXIS_STYLE)
 
-		head.y_range = Range1d(*layout.label.limit)
-		body.y_range = Range1d(*layout.depth.limit)
+	plot.add_layout(LinearAxis(major_label_text_alpha=0,**AXIS_STYLE),'right')
+	plot.add_layout(LinearAxis(major_label_text_alpha=0,**AXIS_STYLE),'above')
 
-		head.x_range = Range1d(*layout[index].limit)
-		body.x_range = Range1d(*layout[index].limit)
+	return plot
 
-		head.xaxis.major_label_text_font_size = '0pt'
-		head.yaxis.major_label_text_font_size = '0pt'
-
-		body.xaxis.major_label_text_font_size = '0pt'
-		body.yaxis.major_label_text_font_size = '0pt'
-
-		head.xaxis.major_tick_in = 0
-		head.yaxis.major_tick_in = 0
-		body.xaxis.major_tick_in = 0
-		body.yaxis.major_tick_in = 0
+def boot(layout):
 
-		head.xaxis.major_tick_out = 0
-		head.yaxis.major_tick_out = 0
-		body.xaxis.major_tick_out = 0
-		body.yaxis.major_tick_out = 0
+	heads,bodys = [],[]
 
-		head.xaxis.minor_tick_in = 0
-		head.yaxis.minor_tick_in = 0
-		body.xaxis.minor_tick_in = 0
-		body.yaxis.minor_tick_in = 0
+	for index in range(layout.trail):
 
-		head.xaxis.minor_tick_out = 0
-		head.yaxis.minor_tick_out = 0
-		body.xaxis.minor_tick_out = 0
-		body.yaxis.minor_tick_out = 0
+		borders = dict(min_border_left=0,min_border_top=0)
 
-		head.min_border_left = 0
 		if index != layout.trail-1:
-			head.min_border_right = 0
+			borders['min_border_right'] = 0
 
-		head.min_border_top = 0
-		head.min_border_bottom = 0
+		head = figure(
+			width=layout.width[index],height=layout.height[0],
+			x_range=Range1d(*layout[index].limit),
+			y_range=Range1d(*layout.label.limit),
+			min_border_bottom=0,**borders)
 
-		body.min_border_left = 0
-		if index != layout.trail-1:
-			body.min_border_right = 0
-		body.min_border_top = 0
-		# body.min_border_bottom = 0
+		body = figure(
+			width=layout.width[index],height=layout.height[1],
+			x_range=Range1d(*layout[index].limit),
+			y_range=Range1d(*layout.depth.limit),
+			**borders)
 
-		head.line((0,20),(10,10))
-		head.line((0,20),(20,20))
+		heads.append(styled(head))
+		bodys.append(styled(body))
 
-		heads.append(head)
-		bodys.append(body)
+		head.multi_line(xs=[(0,20),(0,20)],ys=[(10,10),(20,20)])
 
-	return heads,bodys
\ No newline at end of file
+	return heads,bodys
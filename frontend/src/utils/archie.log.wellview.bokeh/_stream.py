@@ -2,8 +2,14 @@ import copy
 
 from dataclasses import dataclass, field
 
+import functools
+
+import math
+
 import os
 
+import warnings
+
 from bokeh.embed import components
 
 from bokeh.layouts import gridplot
@@ -30,6 +36,56 @@ import lasio
 
 import numpy
 
+TEMPLATE = Template(
+	'''
+	<!DOCTYPE html>
+	<html lang="en">
+		<head>
+			<meta charset="utf-8">
+			<title>LAS Curves - Bokeh Glance</title>
+			{{ java }}
+			{{ css }}
+			{{ script }}
+		<style>
+		.wrapper {
+			display: flex;
+			justify-content: center;
+			align-items: center;
+			margin: 0 auto;
+			}
+		.plotdiv {
+			margin: 0 auto;
+			}
+		</style>
+		</head>
+		<body>
+		<div class='wrapper'>
+			{{ div }}
+		</div>
+		</body>
+	</html>
+	'''
+	)
+
+def quantile2(a:float,b:float,q:float):
+	"""Returns numpy.quantile((a,b),q) in closed form (linear interpolation)."""
+	if math.isnan(a) or math.isnan(b):
+		return math.nan
+
+	lower,upper = (a,b) if a<=b else (b,a)
+
+	return lower+q*(upper-lower)
+
+@functools.cache
+def inline_js():
+	"""Inline BokehJS bundle; identical for every Stream in the process."""
+	return INLINE.render_js()
+
+@functools.cache
+def inline_css():
+	"""Inline Bokeh stylesheet; identical for every Stream in the process."""
+	return INLINE.render_css()
+
 @dataclass(frozen=True)
 class Frame:
 	"""Dictionary for general frame construction."""
@@ -77,7 +133,7 @@ class Stream():
 
 	@file.setter
 	def file(self,lasfile:lasio.LASFile):
-		lasfile.curves = [curve for curve in lasfile.curves if lasfile[curve.mnemonic].dtype == float]
+		lasfile.curves = [curve for curve in lasfile.curves if curve.data.dtype == float]
 		self._file = lasfile
 
 	@property
@@ -209,7 +265,10 @@ class Stream():
 
 		styles = sticky_css if self.frame.head_sticky else {}
 
-		figure = bokeh_figure(width=width,height=height,styles=styles)
+		figure = bokeh_figure(width=width,height=height,styles=styles,
+			x_range=Range1d(*self.frame.head_xrange),
+			y_range=Range1d(*self.frame.head_yrange),
+			above=[self.bold],right=[self.bold])
 
 		figure = self.boothead(figure,index)
 		figure = self.loadhead(figure,index)
@@ -223,7 +282,9 @@ class Stream():
 		if index==1:
 			width += int(width/6)
 
-		figure = bokeh_figure(width=width,height=height)
+		figure = bokeh_figure(width=width,height=height,
+			y_range=Range1d(self.maxdepth,self.mindepth),
+			above=[LinearAxis()],right=[self.bold])
 
 		figure = self.bootbody(figure,index)
 		figure = self.loadbody(figure,index)
@@ -239,15 +300,9 @@ class Stream():
 
 		figure = self.deactivate(figure)
 
-		figure.x_range = Range1d(*self.frame.head_xrange)
-		figure.y_range = Range1d(*self.frame.head_yrange)
-
 		figure = self.trim(figure,"x")
 		figure = self.trim(figure,"y")
 
-		figure.add_layout(self.bold,'above')
-		figure.add_layout(self.bold,'right')
-
 		figure.xgrid.grid_line_color = None
 		figure.ygrid.grid_line_color = None
 
@@ -257,15 +312,9 @@ class Stream():
 
 		figure = self.deactivate(figure)
 
-		figure.add_layout(LinearAxis(),'above')
-
 		if index>1:
 			figure = self.trim(figure,"y")
 
-		figure.add_layout(self.bold,'right')
-
-		figure.y_range = Range1d(self.maxdepth,self.mindepth)
-
 		figure.yaxis.ticker.max_interval = self.frame.depth_space
 
 		figure.ygrid.minor_grid_line_color = 'lightgray'
@@ -283,8 +332,8 @@ class Stream():
 
 		x = numpy.mean(self.frame.head_xrange)
 
-		ymnem = numpy.quantile(self.frame.head_yrange,0.65)
-		yunit = numpy.quantile(self.frame.head_yrange,0.30)
+		ymnem = quantile2(*self.frame.head_yrange,0.65)
+		yunit = quantile2(*self.frame.head_yrange,0.30)
 
 		mnem_label = Label(x=x,y=ymnem,text=mnem,text_font_size='15px',
 			text_align='center',text_baseline="middle")
@@ -299,19 +348,63 @@ class Stream():
 
 	def loadbody(self,figure:bokeh_figure,index:int):
 
-		self.lines.append(figure.line(self.file[index],self.depths))
+		depths,values = self.downsample(self.depths,self.file[index],2*self.height[1])
+
+		self.lines.append(figure.line(values,depths))
 
 		return figure
 
+	@staticmethod
+	def downsample(depths:numpy.ndarray,values:numpy.ndarray,size:int):
+		"""Reduces a curve to at most `size` vertices with Largest-Triangle-Three-Buckets.
+
+		Depths are used as the bucketing axis; the first and last samples are kept.
+		Curves that already fit within `size` vertices are returned unchanged.
+		"""
+		count = depths.size
+
+		if size<3 or count<=size:
+			return depths,values
+
+		edges = numpy.linspace(1,count-1,size-1).astype(int)
+
+		keep = numpy.empty(size,dtype=int)
+		keep[0],keep[-1] = 0,count-1
+
+		point = 0
+
+		with warnings.catch_warnings():
+			warnings.simplefilter("ignore",RuntimeWarning)
+
+			for bucket in range(size-2):
+
+				lower,upper = edges[bucket],edges[bucket+1]
+
+				after = edges[bucket+2] if bucket+2<size-1 else count
+
+				xmean = numpy.nanmean(depths[upper:after])
+				ymean = numpy.nanmean(values[upper:after])
+
+				area = numpy.abs(
+					(depths[point]-xmean)*(values[lower:upper]-values[point])-
+					(depths[point]-depths[lower:upper])*(ymean-values[point]))
+
+				area[numpy.isnan(area)] = -1.
+
+				point = lower+int(numpy.argmax(area))
+
+				keep[bucket+1] = point
+
+		return depths[keep],values[keep]
+
 	def spanbody(self,figure:bokeh_figure,index:int):
 
 		figure.add_layout(self.spanline)
 
-		xmin = numpy.nan if numpy.all(numpy.isnan(self.file[index])) else numpy.nanmin(self.file[index])
-		xmax = numpy.nan if numpy.all(numpy.isnan(self.file[index])) else numpy.nanmax(self.file[index])
+		xmin,xmax = self.extent(self.file[index])
 
 		# Adding the depth value of spanline as a label
-		x = numpy.quantile((xmin,xmax),0.7)
+		x = quantile2(xmin,xmax,0.7)
 
 		spanlabel = Label(
 			x = x,
@@ -353,9 +446,10 @@ class Stream():
 
 	def hintbody(self,figure:bokeh_figure,index:int):
 
-		xarray = numpy.abs(self.file[index])
+		xarray = self.file[index]
+		xarray = xarray[xarray!=0]
 
-		xvalue = numpy.nan if numpy.all(numpy.isnan(xarray)) else numpy.nanmin(xarray[xarray!=0])
+		xvalue,_ = self.extent(numpy.abs(xarray,out=xarray))
 
 		power = 1 if numpy.isnan(xvalue) else -int(numpy.floor(numpy.log10(xvalue)))
 
@@ -413,7 +507,7 @@ class Stream():
 		xmin = numpy.nanmin(self.file[index]) if numpy.isnan(xlim[0]) else xlim[0]
 		xmax = numpy.nanmax(self.file[index]) if numpy.isnan(xlim[1]) else xlim[1]
 
-		self.spanlabels[index].x = numpy.quantile((xmin,xmax),0.7)
+		self.spanlabels[index].x = quantile2(xmin,xmax,0.7)
 
 	def overlay(self,key:str,tokey:str,multp:float=1,shift:float=0,line:dict=None,left:bool=None,**kwargs):
 
@@ -441,13 +535,11 @@ class Stream():
 		linemap = {f"line_{key}":value for key,value in kwargs.items()}
 
 		for index in range(1,self.curves+1):
-			if not numpy.all(numpy.isnan(self.file[index])):
+			xmin,xmax = self.extent(self.file[index])
+			if not numpy.isnan(xmin):
 				break
 
-		xmin = numpy.nan if numpy.all(numpy.isnan(self.file[index])) else numpy.nanmin(self.file[index])
-		xmax = numpy.nan if numpy.all(numpy.isnan(self.file[index])) else numpy.nanmax(self.file[index])
-
-		x = numpy.quantile((xmin,xmax),0.5)
+		x = quantile2(xmin,xmax,0.5)
 
 		for key,value in topdict.items():
 
@@ -469,6 +561,16 @@ class Stream():
 
 			self.bodys[index-1].add_layout(formation_top_name)
 
+	@staticmethod
+	def extent(array:numpy.ndarray):
+		"""Returns (nanmin,nanmax) of the array; both are nan when it has no data."""
+		if array.size==0:
+			return numpy.nan,numpy.nan
+
+		with warnings.catch_warnings():
+			warnings.simplefilter("ignore",RuntimeWarning)
+			return numpy.nanmin(array),numpy.nanmax(array)
+
 	@staticmethod
 	def deactivate(figure:bokeh_figure):
 
@@ -498,36 +600,7 @@ class Stream():
 
 	@property
 	def template(self):
-		return Template(
-			'''
-			<!DOCTYPE html>
-			<html lang="en">
-				<head>
-					<meta charset="utf-8">
-					<title>LAS Curves - Bokeh Glance</title>
-					{{ java }}
-					{{ css }}
-					{{ script }}
-				<style>
-				.wrapper {
-					display: flex;
-					justify-content: center;
-					align-items: center;
-					margin: 0 auto;
-					}
-				.plotdiv {
-					margin: 0 auto;
-					}
-				</style>
-				</head>
-				<body>
-				<div class='wrapper'>
-					{{ div }}
-				</div>
-				</body>
-			</html>
-			'''
-			)
+		return TEMPLATE
 
 	@property
 	def bold(self):
@@ -539,11 +612,11 @@ class Stream():
 
 	@property
 	def java(self):
-		return INLINE.render_js()
+		return inline_js()
 
 	@property
 	def css(self):
-		return INLINE.render_css()
+		return inline_css()
 
 	def show(self):
 
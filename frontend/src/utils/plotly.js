@@ -15,3 +15,103 @@ export async function loadPlotly() {
   }
   return loadPromise;
 }
+
+function toNumber(value) {
+  return value === null || value === undefined ? NaN : Number(value);
+}
+
+/**
+ * Largest-Triangle-Three-Buckets point selection.
+ *
+ * Returns the indices of at most ~`threshold` points of `values` that keep the
+ * visual shape of the curve, or null when no downsampling is needed. `axis` is
+ * the monotonic coordinate (e.g. depth or time); the array index is used when
+ * omitted. Non-finite values are kept once per bucket so line gaps survive.
+ * An axis with missing or non-numeric entries (e.g. date strings) cannot be
+ * used for triangle areas, so null is returned and the curve is drawn as is.
+ */
+export function lttbIndices(values, threshold, axis = null) {
+  const n = values?.length ?? 0;
+  if (threshold < 3 || n <= threshold) return null;
+
+  if (axis) {
+    if (axis.length < n) return null;
+    for (let i = 0; i < n; i++) {
+      if (!Number.isFinite(toNumber(axis[i]))) return null;
+    }
+  }
+
+  const at = axis ? (i) => toNumber(axis[i]) : (i) => i;
+  const every = (n - 2) / (threshold - 2);
+  const out = [0];
+
+  let a = 0;
+  for (let b = 0; b < threshold - 2; b++) {
+    const start = Math.floor(b * every) + 1;
+    const end = Math.min(Math.floor((b + 1) * every) + 1, n - 1);
+    const nextEnd = Math.min(Math.floor((b + 2) * every) + 1, n);
+
+    // average of the next bucket is the third triangle vertex
+    let avgX = 0;
+    let avgY = 0;
+    let count = 0;
+    for (let j = end; j < nextEnd; j++) {
+      const y = toNumber(values[j]);
+      if (!Number.isFinite(y)) continue;
+      avgX += at(j);
+      avgY += y;
+      count++;
+    }
+    // the anchor may be a gap (e.g. a leading NaN); fall back to the mean of
+    // this bucket's finite points so the areas below stay comparable
+    let anchorY = toNumber(values[a]);
+    if (!Number.isFinite(anchorY)) {
+      let sum = 0;
+      let finite = 0;
+      for (let j = start; j < end; j++) {
+        const y = toNumber(values[j]);
+        if (!Number.isFinite(y)) continue;
+        sum += y;
+        finite++;
+      }
+      anchorY = finite ? sum / finite : NaN;
+    }
+
+    if (count) {
+      avgX /= count;
+      avgY /= count;
+    } else {
+      avgX = at(Math.min(end, n - 1));
+      avgY = anchorY;
+    }
+
+    const ax = at(a);
+    const ay = Number.isFinite(anchorY) ? anchorY : avgY;
+
+    let best = -1;
+    let bestArea = -1;
+    let gap = -1;
+    for (let j = start; j < end; j++) {
+      const y = toNumber(values[j]);
+      if (!Number.isFinite(y)) {
+        if (gap < 0) gap = j;
+        continue;
+      }
+      const area = Math.abs((ax - avgX) * (y - ay) - (ax - at(j)) * (avgY - ay));
+      if (area > bestArea) {
+        bestArea = area;
+        best = j;
+      }
+    }
+
+    if (gap >= 0 && (best < 0 || gap < best)) out.push(gap);
+    if (best >= 0) {
+      out.push(best);
+      a = best;
+    }
+    if (gap > best && best >= 0) out.push(gap);
+  }
+
+  out.push(n - 1);
+  return out;
+}
@@ -35,6 +35,74 @@ function assertPositiveSize(width, height) {
   }
 }
 
+const HTML_CACHE_LIMIT = 512;
+const htmlCache = new Map();
+
+const CENTERED_STYLE = "position:absolute;top:50%;left:50%";
+const RECT_STATIC_STYLE = "transform-origin:center center;box-sizing:border-box";
+const LABEL_STATIC_STYLE =
+  "transform-origin:center center;white-space:nowrap;pointer-events:none";
+
+function escapeHtml(value) {
+  return String(value)
+    .replace(/&/g, "&amp;")
+    .replace(/</g, "&lt;")
+    .replace(/>/g, "&gt;")
+    .replace(/"/g, "&quot;")
+    .replace(/'/g, "&#39;");
+}
+
+function buildPlatformHtml(
+  width,
+  height,
+  angle,
+  fill,
+  border,
+  borderPx,
+  cornerRadius,
+  label,
+  labelColor,
+  labelSizePx,
+  labelBold,
+  className
+) {
+  const radians = (angle * Math.PI) / 180;
+  const cos = Math.abs(Math.cos(radians));
+  const sin = Math.abs(Math.sin(radians));
+
+  const containerWidth = Math.round(width * cos + height * sin);
+  const containerHeight = Math.round(width * sin + height * cos);
+
+  const classAttr = className ? ` class="${escapeHtml(className)}"` : "";
+  const transform = `transform:translate(-50%, -50%) rotate(${angle}deg)`;
+
+  const rectStyle =
+    `${CENTERED_STYLE};width:${width}px;height:${height}px;${transform};` +
+    `background:${fill};border:${borderPx}px solid ${border};` +
+    `border-radius:${cornerRadius}px;${RECT_STATIC_STYLE}`;
+
+  let labelHtml = "";
+  if (label !== null && label !== undefined) {
+    const labelStyle =
+      `${CENTERED_STYLE};${transform};font-size:${labelSizePx}px;` +
+      `color:${labelColor};font-weight:${labelBold ? "700" : "400"};` +
+      LABEL_STATIC_STYLE;
+    labelHtml = `<div style="${escapeHtml(labelStyle)}">${escapeHtml(label)}</div>`;
+  }
+
+  const outerStyle = `position:relative;width:${containerWidth}px;height:${containerHeight}px`;
+
+  return {
+    html:
+      `<div${classAttr} style="${outerStyle}">` +
+      `<div style="${escapeHtml(rectStyle)}"></div>` +
+      labelHtml +
+      "</div>",
+    size: [containerWidth, containerHeight],
+    anchor: [Math.floor(containerWidth / 2), Math.floor(containerHeight / 2)],
+  };
+}
+
 function buildPlatformElements(options) {
   const {
     width,
@@ -54,56 +122,35 @@ function buildPlatformElements(options) {
   assertPositiveSize(width, height);
 
   const angle = normalizeAngle(angleDeg);
-  const radians = (angle * Math.PI) / 180;
-
-  const containerWidth = Math.round(
-    Math.abs(width * Math.cos(radians)) + Math.abs(height * Math.sin(radians))
-  );
-  const containerHeight = Math.round(
-    Math.abs(width * Math.sin(radians)) + Math.abs(height * Math.cos(radians))
-  );
-
-  const outer = document.createElement("div");
-  if (className) outer.className = className;
-  outer.style.position = "relative";
-  outer.style.width = `${containerWidth}px`;
-  outer.style.height = `${containerHeight}px`;
-
-  const rect = document.createElement("div");
-  rect.style.position = "absolute";
-  rect.style.top = "50%";
-  rect.style.left = "50%";
-  rect.style.width = `${width}px`;
-  rect.style.height = `${height}px`;
-  rect.style.transform = `translate(-50%, -50%) rotate(${angle}deg)`;
-  rect.style.transformOrigin = "center center";
-  rect.style.background = fill;
-  rect.style.border = `${borderPx}px solid ${border}`;
-  rect.style.borderRadius = `${cornerRadius}px`;
-  rect.style.boxSizing = "border-box";
-  outer.appendChild(rect);
+  const args = [
+    width,
+    height,
+    angle,
+    fill,
+    border,
+    borderPx,
+    cornerRadius,
+    label === null || label === undefined ? null : String(label),
+    labelColor,
+    labelSizePx,
+    Boolean(labelBold),
+    className || "",
+  ];
 
-  if (label !== null && label !== undefined) {
-    const labelDiv = document.createElement("div");
-    labelDiv.style.position = "absolute";
-    labelDiv.style.top = "50%";
-    labelDiv.style.left = "50%";
-    labelDiv.style.transform = `translate(-50%, -50%) rotate(${angle}deg)`;
-    labelDiv.style.transformOrigin = "center center";
-    labelDiv.style.fontSize = `${labelSizePx}px`;
-    labelDiv.style.color = labelColor;
-    labelDiv.style.fontWeight = labelBold ? "700" : "400";
-    labelDiv.style.whiteSpace = "nowrap";
-    labelDiv.style.pointerEvents = "none";
-    labelDiv.textContent = String(label);
-    outer.appendChild(labelDiv);
+  // Many platforms on a map share the same style; reuse the assembled markup.
+  const key = JSON.stringify(args);
+  let cached = htmlCache.get(key);
+  if (cached) {
+    htmlCache.delete(key);
+  } else {
+    cached = buildPlatformHtml(...args);
+    if (htmlCache.size >= HTML_CACHE_LIMIT) {
+      htmlCache.delete(htmlCache.keys().next().value);
+    }
   }
+  htmlCache.set(key, cached);
 
-  return {
-    html: outer,
-    size: [containerWidth, containerHeight],
-    anchor: [Math.floor(containerWidth / 2), Math.floor(containerHeight / 2)],
-  };
+  return cached;
 }
 
 export function createPlatformIcon(userOptions = {}, explicitLeaflet) {
@@ -117,8 +164,8 @@ export function createPlatformIcon(userOptions = {}, explicitLeaflet) {
 
   return L.divIcon({
     html,
-    iconSize: size,
-    iconAnchor: anchor,
+    iconSize: [...size],
+    iconAnchor: [...anchor],
     className: options.wrapperClassName || "",
   });
 }
@@ -44,7 +44,27 @@ const MODERN_STYLE = `
   outline: 2px solid #60a5fa;
   outline-offset: 2px;
 }
-`;
+`.trim();
+
+const CLASSIC_BUTTON_STYLE = [
+  "width:30px",
+  "height:30px",
+  "line-height:30px",
+  "text-align:center",
+  "font-size:16px",
+  "text-decoration:none",
+  "background-color:white",
+  "color:black",
+  "display:block",
+  "border-bottom:1px solid #ccc",
+].join(";");
+
+const MODERN_BUTTON_HTML = `
+    <svg viewBox="0 0 24 24" aria-hidden="true">
+      <circle cx="12" cy="12" r="8" fill="none" stroke="currentColor" stroke-width="2"/>
+      <path d="M12 4v3 M12 17v3 M4 12h3 M17 12h3" stroke="currentColor" stroke-width="2" stroke-linecap="round" fill="none"/>
+    </svg>
+  `;
 
 function resolveLeaflet(explicitLeaflet) {
   if (explicitLeaflet) return explicitLeaflet;
@@ -77,16 +97,7 @@ function buildClassicControl(L, map, { lat, lon, zoom }) {
   button.title = "Re-center";
   button.href = "#";
 
-  button.style.width = "30px";
-  button.style.height = "30px";
-  button.style.lineHeight = "30px";
-  button.style.textAlign = "center";
-  button.style.fontSize = "16px";
-  button.style.textDecoration = "none";
-  button.style.backgroundColor = "white";
-  button.style.color = "black";
-  button.style.display = "block";
-  button.style.borderBottom = "1px solid #ccc";
+  button.style.cssText = CLASSIC_BUTTON_STYLE;
 
   button.onmouseover = function onMouseOver() {
     this.style.backgroundColor = "#f4f4f4";
@@ -122,12 +133,7 @@ function buildModernControl(L, map, { lat, lon, zoom }) {
   button.setAttribute("role", "button");
   button.setAttribute("aria-label", "Re-center map");
 
-  button.innerHTML = `
-    <svg viewBox="0 0 24 24" aria-hidden="true">
-      <circle cx="12" cy="12" r="8" fill="none" stroke="currentColor" stroke-width="2"/>
-      <path d="M12 4v3 M12 17v3 M4 12h3 M17 12h3" stroke="currentColor" stroke-width="2" stroke-linecap="round" fill="none"/>
-    </svg>
-  `;
+  button.innerHTML = MODERN_BUTTON_HTML;
 
   const recenter = (event) => {
     if (event) L.DomEvent.stop(event);
@@ -164,7 +170,7 @@ export function Recenter({
     if (!L || !map) return;
 
     if (variant === "modern") {
-      const css = [MODERN_STYLE.trim(), styleCss.trim()].filter(Boolean).join("\n");
+      const css = [MODERN_STYLE, styleCss.trim()].filter(Boolean).join("\n");
       ensureStyleTag(styleId, css);
     }
 
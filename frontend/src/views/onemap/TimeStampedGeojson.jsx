@@ -13,12 +13,27 @@ function normalizeDate(value) {
   return parsed;
 }
 
+// Valid month and a day every month has (01-28). Anything else, including
+// days 29-31 that Date rolls into the next month, goes through normalizeDate.
+const ISO_DATE_RE = /^(\d{4}-(?:0[1-9]|1[0-2]))-(?:0[1-9]|1\d|2[0-8])$/;
+
 function toMonthKey(date) {
   const year = date.getUTCFullYear();
   const month = String(date.getUTCMonth() + 1).padStart(2, "0");
   return `${year}-${month}-01`;
 }
 
+function rateMonthKey(value) {
+  // Plain ISO dates parse as UTC midnight, so the month can be read off the
+  // string without allocating a Date for every rate row.
+  if (typeof value === "string") {
+    const match = ISO_DATE_RE.exec(value);
+    if (match) return `${match[1]}-01`;
+  }
+  const date = normalizeDate(value);
+  return date ? toMonthKey(date) : null;
+}
+
 const DEFAULT_ICON_STYLE = {
   fillColor: "#22c55e",
   fillOpacity: 0.8,
@@ -98,16 +113,27 @@ export function buildTimeStampedGeojson({
   const features = [];
   const monthsByWell = new Map();
 
+  // Every feature carries the same styling; share one object per layer.
+  const featureIconStyle = Object.freeze({
+    ...DEFAULT_ICON_STYLE,
+    fillColor: color,
+    ...iconStyle,
+  });
+  const featureStyle = Object.freeze({ color, ...style });
+
   rates.forEach((rate) => {
     if (!rate) return;
     const wellId = rate[rateWellKey];
     if (wellId === null || wellId === undefined) return;
-    const date = normalizeDate(rate[rateDateKey]);
-    if (!date) return;
-    const monthKey = toMonthKey(date);
-    const key = String(wellId);
-    if (!monthsByWell.has(key)) monthsByWell.set(key, new Set());
-    monthsByWell.get(key).add(monthKey);
+    const monthKey = rateMonthKey(rate[rateDateKey]);
+    if (!monthKey) return;
+    const key = typeof wellId === "string" ? wellId : String(wellId);
+    let months = monthsByWell.get(key);
+    if (!months) {
+      months = new Set();
+      monthsByWell.set(key, months);
+    }
+    months.add(monthKey);
   });
 
   wells.forEach((well) => {
@@ -121,16 +147,17 @@ export function buildTimeStampedGeojson({
     const monthKeys = monthsByWell.get(String(wellId));
     if (!monthKeys || monthKeys.size === 0) return;
 
-    monthKeys.forEach((monthKey) => {
+    const popup = String(wellId);
+    Array.from(monthKeys).sort().forEach((monthKey) => {
       features.push({
         type: "Feature",
         geometry: { type: "Point", coordinates: [lon, lat] },
         properties: {
           time: monthKey,
-          popup: String(wellId),
+          popup,
           icon: "circle",
-          iconstyle: { ...DEFAULT_ICON_STYLE, fillColor: color, ...iconStyle },
-          style: { color, ...style },
+          iconstyle: featureIconStyle,
+          style: featureStyle,
         },
       });
     });